@@ -9,7 +9,7 @@ from setuptools import setup, find_namespace_packages
 
 from src.revpimodio2.__about__ import __version__
 
-with open("README.md") as fh:
+with open("README.md", encoding="utf-8") as fh:
     # Load long description from readme file
     long_description = fh.read()
 
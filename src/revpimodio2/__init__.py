@@ -12,7 +12,7 @@ Mit den definierten Namen greift man direkt auf die gewuenschten Daten zu.
 Auf alle IOs kann der Benutzer Funktionen als Events registrieren. Diese
 fuehrt das Modul bei Datenaenderung aus.
 """
-__all__ = [
+__all__ = (
     "IOEvent",
     "RevPiModIO",
     "RevPiModIODriver",
@@ -33,15 +33,77 @@ __all__ = [
     "DIO",
     "FLAT",
     "MIO",
-]
+)
 __author__ = "Sven Sager <akira@revpimodio.org>"
 __copyright__ = "Copyright (C) 2023 Sven Sager"
 __license__ = "LGPLv2"
 
+from sys import version_info as _version_info
+
 from .__about__ import __version__
 from ._internal import *
-from .helper import Cycletools, EventCallback
-from .io import IOEvent
-from .modio import RevPiModIO, RevPiModIODriver, RevPiModIOSelected, run_plc
-from .netio import RevPiNetIO, RevPiNetIODriver, RevPiNetIOSelected, run_net_plc
-from .pictory import ProductType, DeviceType, AIO, COMPACT, DI, DO, DIO, FLAT, MIO
+
+# Submodule of each public name, which is imported on first access
+_lazy_modules = {
+    "IOEvent": "io",
+    "RevPiModIO": "modio",
+    "RevPiModIODriver": "modio",
+    "RevPiModIOSelected": "modio",
+    "run_plc": "modio",
+    "RevPiNetIO": "netio",
+    "RevPiNetIODriver": "netio",
+    "RevPiNetIOSelected": "netio",
+    "run_net_plc": "netio",
+    "Cycletools": "helper",
+    "EventCallback": "helper",
+    "ProductType": "pictory",
+    "DeviceType": "pictory",
+    "AIO": "pictory",
+    "COMPACT": "pictory",
+    "DI": "pictory",
+    "DO": "pictory",
+    "DIO": "pictory",
+    "FLAT": "pictory",
+    "MIO": "pictory",
+}
+
+# Submodules, which were bound by the eager imports before and are imported on first access
+_lazy_submodules = frozenset(
+    ("app", "device", "errors", "helper", "io", "modio", "netio", "pictory", "summary")
+)
+
+# Without typing import, static analysis treats the constant as True
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    # Static analysis and linters see the names of __all__ without importing them at runtime
+    from .helper import Cycletools, EventCallback
+    from .io import IOEvent
+    from .modio import RevPiModIO, RevPiModIODriver, RevPiModIOSelected, run_plc
+    from .netio import RevPiNetIO, RevPiNetIODriver, RevPiNetIOSelected, run_net_plc
+    from .pictory import ProductType, DeviceType, AIO, COMPACT, DI, DO, DIO, FLAT, MIO
+
+if _version_info >= (3, 7):
+
+    def __getattr__(name: str):
+        """Import submodule of public name or the submodule itself on first access (PEP 562)."""
+        from importlib import import_module
+
+        if name in _lazy_submodules:
+            # The import binds the submodule as attribute of this package
+            return import_module("." + name, __name__)
+        if name not in _lazy_modules:
+            raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+
+        value = getattr(import_module("." + _lazy_modules[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()).union(_lazy_modules, _lazy_submodules))
+
+else:
+    from importlib import import_module as _import_module
+
+    for _name, _module in _lazy_modules.items():
+        globals()[_name] = getattr(_import_module("." + _module, __name__), _name)
+    del _import_module, _name, _module
@@ -21,6 +21,25 @@ OUT = 301
 MEM = 302
 PROCESS_IMAGE_SIZE = 4096
 
+# Namen der Konstanten fuer consttostr
+_const_names = {
+    OFF: "OFF",
+    GREEN: "GREEN",
+    RED: "RED",
+    ORANGE: "ORANGE",
+    BLUE: "BLUE",
+    CYAN: "CYAN",
+    MAGENTA: "MAGENTA",
+    WHITE: "WHITE",
+    RISING: "RISING",
+    FALLING: "FALLING",
+    BOTH: "BOTH",
+    INP: "INP",
+    OUT: "OUT",
+    MEM: "MEM",
+    PROCESS_IMAGE_SIZE: "PROCESS_IMAGE_SIZE",
+}
+
 
 def acheck(check_type, **kwargs) -> None:
     """
@@ -31,16 +50,20 @@ def acheck(check_type, **kwargs) -> None:
     :param check_type: Type to check
     :param kwargs: Arguments to check
     """
-    for var_name in kwargs:
+    for var_name, value in kwargs.items():
+        if isinstance(value, check_type):
+            continue
+
         none_okay = var_name.endswith("_noneok")
+        if none_okay and value is None:
+            continue
 
-        if not (isinstance(kwargs[var_name], check_type) or none_okay and kwargs[var_name] is None):
-            msg = "Argument '{0}' must be {1}{2}".format(
-                var_name.rstrip("_noneok"),
-                str(check_type),
-                " or <class 'NoneType'>" if none_okay else "",
-            )
-            raise TypeError(msg)
+        msg = "Argument '{0}' must be {1}{2}".format(
+            var_name[:-7] if none_okay else var_name,
+            str(check_type),
+            " or <class 'NoneType'>" if none_okay else "",
+        )
+        raise TypeError(msg)
 
 
 def consttostr(value) -> str:
@@ -52,35 +75,4 @@ def consttostr(value) -> str:
     :param value: Konstantenwert
     :return: <class 'str'> Name der Konstanten
     """
-    if value == 0:
-        return "OFF"
-    elif value == 1:
-        return "GREEN"
-    elif value == 2:
-        return "RED"
-    elif value == 3:
-        return "ORANGE"
-    elif value == 4:
-        return "BLUE"
-    elif value == 5:
-        return "CYAN"
-    elif value == 6:
-        return "MAGENTA"
-    elif value == 7:
-        return "WHITE"
-    elif value == 31:
-        return "RISING"
-    elif value == 32:
-        return "FALLING"
-    elif value == 33:
-        return "BOTH"
-    elif value == 300:
-        return "INP"
-    elif value == 301:
-        return "OUT"
-    elif value == 302:
-        return "MEM"
-    elif value == 4096:
-        return "PROCESS_IMAGE_SIZE"
-    else:
-        return ""
+    return _const_names.get(value, "")
@@ -4,8 +4,29 @@ __author__ = "Sven Sager"
 __copyright__ = "Copyright (C) 2023 Sven Sager"
 __license__ = "LGPLv2"
 
+from functools import lru_cache
 from time import gmtime, strptime
 
+# Zeitstempel fuer ungueltige saveTS Werte, struct_time ist unveraenderlich
+_epoch = gmtime(0)
+
+
+@lru_cache(maxsize=8)
+def _parse_savets(savets: str):
+    """
+    Wandelt den piCtory Zeitstempel in eine struct_time um.
+
+    Gleiche Zeitstempel werden beim erneuten Laden der Konfiguration nicht
+    nochmals geparst.
+
+    :param savets: Zeitstempel im Format YYYYmmddHHMMSS
+    :return: <class 'time.struct_time'>, bei ungueltigem Datum _epoch
+    """
+    try:
+        return strptime(savets, "%Y%m%d%H%M%S")
+    except ValueError:
+        return _epoch
+
 
 class App:
     """Bildet die App Sektion der config.rsc ab."""
@@ -31,10 +52,12 @@ class App:
         """Timestamp of configuraiton"""
 
         if self.savets is not None:
-            try:
-                self.savets = strptime(self.savets, "%Y%m%d%H%M%S")
-            except Exception:
-                self.savets = gmtime(0)
+            # Nur 14 Ziffern koennen ein gueltiger Zeitstempel sein
+            savets = self.savets
+            if isinstance(savets, str) and len(savets) == 14 and savets.isdigit():
+                self.savets = _parse_savets(savets)
+            else:
+                self.savets = _epoch
 
         # TODO: Layout untersuchen und anders abbilden
         self.layout = app.get("layout", {})
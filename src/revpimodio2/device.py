@@ -5,7 +5,7 @@ __copyright__ = "Copyright (C) 2023 Sven Sager"
 __license__ = "LGPLv2"
 
 import warnings
-from struct import unpack
+from struct import Struct
 from threading import Event, Lock, Thread
 
 from ._internal import INP, OUT, MEM, PROCESS_IMAGE_SIZE
@@ -13,13 +13,36 @@ from .helper import ProcimgWriter
 from .io import IOBase, IntIO, IntIOCounter, IntIOReplaceable, MemIO, RelaisOutput, IntRelaisOutput
 from .pictory import ProductType
 
+# Vorkompilierte Formate für 2 Byte Statuswerte (little endian)
+_pack_u16_into = Struct("<H").pack_into
+_unpack_u16_from = Struct("<H").unpack_from
 
-class DeviceList(object):
+
+def _statusbit(mask: int, doc: str) -> property:
+    """
+    Erzeugt eine Property fuer ein Bit aus dem Statusbyte.
+
+    :param mask: Bitmaske im Statusbyte
+    :param doc: Dokumentation der Property
+    :return: <class 'property'> mit <class 'bool'> Wert des Bits
+    """
+
+    def get_bit(self) -> bool:
+        return bool(self._ba_devdata[self._slc_statusbyte.start] & mask)
+
+    return property(get_bit, doc=doc)
+
+
+class DeviceList:
     """Basisklasse fuer direkten Zugriff auf Device Objekte."""
 
+    # Devices liegen als Attribute im __dict__, interne Daten in Slots
+    __slots__ = "__dict__", "__dict_position", "__sorted_by_offset"
+
     def __init__(self):
         """Init DeviceList class."""
         self.__dict_position = {}
+        self.__sorted_by_offset = ()
 
     def __contains__(self, key):
         """
@@ -28,10 +51,12 @@ class DeviceList(object):
         :param key: DeviceName <class 'str'> / Positionsnummer <class 'int'>
         :return: True, wenn Device vorhanden
         """
-        if type(key) == int:
+        if isinstance(key, int):
             return key in self.__dict_position
-        elif type(key) == str:
+        elif isinstance(key, str):
             return hasattr(self, key)
+        elif isinstance(key, Device):
+            return self.__dict_position.get(key._position) is key
         else:
             return key in self.__dict_position.values()
 
@@ -44,7 +69,7 @@ class DeviceList(object):
         """
         if delcomplete:
             # Device finden
-            if type(key) == int:
+            if isinstance(key, int):
                 dev_del = self.__dict_position[key]
                 key = dev_del._name
             else:
@@ -57,6 +82,7 @@ class DeviceList(object):
 
             # Device aus dict löschen
             del self.__dict_position[dev_del._position]
+            self.__sorted_by_offset = None
 
         if hasattr(self, key):
             object.__delattr__(self, key)
@@ -78,10 +104,11 @@ class DeviceList(object):
         :param key: DeviceName <class 'str'> / Positionsnummer <class 'int'>
         :return: Gefundenes <class 'Device'>-Objekt
         """
-        if type(key) == int:
-            if key not in self.__dict_position:
+        if isinstance(key, int):
+            try:
+                return self.__dict_position[key]
+            except KeyError:
                 raise IndexError("no device on position {0}".format(key))
-            return self.__dict_position[key]
         else:
             return getattr(self, key)
 
@@ -94,8 +121,12 @@ class DeviceList(object):
 
         :return: <class 'iter'> aller Devices
         """
-        for dev in sorted(self.__dict_position, key=lambda key: self.__dict_position[key]._offset):
-            yield self.__dict_position[dev]
+        # Sortierung nur nach Änderung der Devices neu berechnen
+        order = self.__sorted_by_offset
+        if order is None:
+            order = tuple(sorted(self.__dict_position.values(), key=lambda dev: dev._offset))
+            self.__sorted_by_offset = order
+        return iter(order)
 
     def __len__(self):
         """
@@ -114,11 +145,12 @@ class DeviceList(object):
         if isinstance(value, Device):
             object.__setattr__(self, key, value)
             self.__dict_position[value._position] = value
-        elif key == "_DeviceList__dict_position":
+            object.__setattr__(self, "_DeviceList__sorted_by_offset", None)
+        elif key in ("_DeviceList__dict_position", "_DeviceList__sorted_by_offset"):
             object.__setattr__(self, key, value)
 
 
-class Device(object):
+class Device:
     """
     Basisklasse fuer alle Device-Objekte.
 
@@ -128,7 +160,13 @@ class Device(object):
     """
 
     __slots__ = (
+        "__my_allios",
+        "__my_inputs",
+        "__my_io_addresses",
         "__my_io_list",
+        "__my_io_names",
+        "__my_memories",
+        "__my_outputs",
         "_ba_devdata",
         "_ba_datacp",
         "_dict_events",
@@ -142,6 +180,7 @@ class Device(object):
         "_slc_devoff",
         "_slc_inp",
         "_slc_inpoff",
+        "_slc_iooff",
         "_slc_mem",
         "_slc_memoff",
         "_slc_out",
@@ -169,20 +208,23 @@ class Device(object):
         """
         self._modio = parentmodio
 
-        self._ba_devdata = bytearray()
-        self._ba_datacp = bytearray()  # Copy for event detection
         self._dict_events = {}
         self._filelock = Lock()
+        self.__my_allios = ()
+        self.__my_inputs = ()
         self.__my_io_list = []
+        self.__my_memories = ()
+        self.__my_outputs = ()
         self._selfupdate = False
         self._shared_procimg = False
         self._shared_write = set()
 
         # Wertzuweisung aus dict_device
-        self._name = dict_device.get("name")
-        self._offset = int(dict_device.get("offset"))
-        self._position = int(dict_device.get("position"))
-        self._producttype = int(dict_device.get("productType"))
+        get = dict_device.get
+        self._name = get("name")
+        self._offset = int(get("offset"))
+        self._position = int(get("position"))
+        self._producttype = int(get("productType"))
 
         # Offset-Check for broken piCtory configuration
         if self._offset < parentmodio.length:
@@ -195,12 +237,25 @@ class Device(object):
             )
         # IOM-Objekte erstellen und Adressen in SLCs speichern
         if simulator:
-            self._slc_inp = self._buildio(dict_device.get("out"), INP)
-            self._slc_out = self._buildio(dict_device.get("inp"), OUT)
+            self._slc_inp = self._buildio(get("out"), INP)
+            self._slc_out = self._buildio(get("inp"), OUT)
         else:
-            self._slc_inp = self._buildio(dict_device.get("inp"), INP)
-            self._slc_out = self._buildio(dict_device.get("out"), OUT)
-        self._slc_mem = self._buildio(dict_device.get("mem"), MEM)
+            self._slc_inp = self._buildio(get("inp"), INP)
+            self._slc_out = self._buildio(get("out"), OUT)
+        self._slc_mem = self._buildio(get("mem"), MEM)
+
+        # Prozessabbildpuffer für alle Bereiche einmalig anlegen
+        self._ba_devdata = bytearray(
+            self._slc_inp.stop
+            - self._slc_inp.start
+            + self._slc_out.stop
+            - self._slc_out.start
+            + self._slc_mem.stop
+            - self._slc_mem.start
+        )
+
+        # Kopie für Eventerkennung einmalig in gleicher Größe anlegen
+        self._ba_datacp = bytearray(len(self._ba_devdata))
 
         # SLCs mit offset berechnen
         self._slc_devoff = slice(self._offset, self._offset + self.length)
@@ -216,17 +271,19 @@ class Device(object):
             self._slc_mem.start + self._offset,
             self._slc_mem.stop + self._offset,
         )
+        # Inputs und Outputs ohne MEMs für get_allios()
+        self._slc_iooff = slice(self._slc_inpoff.start, self._slc_outoff.stop)
 
         # Alle restlichen attribute an Klasse anhängen
-        self.bmk = dict_device.get("bmk", "")
-        self.catalognr = dict_device.get("catalogNr", "")
-        self.comment = dict_device.get("comment", "")
-        self.extend = dict_device.get("extend", {})
-        self.guid = dict_device.get("GUID", "")
-        self.id = dict_device.get("id", "")
-        self.inpvariant = dict_device.get("inpVariant", 0)
-        self.outvariant = dict_device.get("outVariant", 0)
-        self.type = dict_device.get("type", "")
+        self.bmk = get("bmk", "")
+        self.catalognr = get("catalogNr", "")
+        self.comment = get("comment", "")
+        self.extend = get("extend", {})
+        self.guid = get("GUID", "")
+        self.id = get("id", "")
+        self.inpvariant = get("inpVariant", 0)
+        self.outvariant = get("outVariant", 0)
+        self.type = get("type", "")
 
         # Spezielle Konfiguration von abgeleiteten Klassen durchführen
         self._devconfigure()
@@ -253,14 +310,10 @@ class Device(object):
             # Umwandlung für key
             key = key._name
 
-        if type(key) == int:
-            if key in self._modio.io:
-                for io in self._modio.io[key]:
-                    if io is not None and io._parentdevice == self:
-                        return True
-            return False
+        if isinstance(key, int):
+            return key in self.__my_io_addresses
         else:
-            return key in self._modio.io and getattr(self._modio.io, key)._parentdevice == self
+            return key in self.__my_io_names
 
     def __getitem__(self, key):
         """
@@ -303,6 +356,19 @@ class Device(object):
         """
         return self._name
 
+    @staticmethod
+    def __filter_export(tup_io: tuple, export) -> list:
+        """
+        Filtert vorberechnete IOs nach dem 'Export' Flag.
+
+        :param tup_io: <class 'tuple'> mit IOs
+        :param export: Filter fuer 'Export' Flag in piCtory
+        :return: <class 'list'> mit IOs
+        """
+        if export is None:
+            return list(tup_io)
+        return [io for io in tup_io if io.export == export]
+
     def __getioiter(self, ioslc: slice, export):
         """
         Gibt <class 'iter'> mit allen IOs zurueck.
@@ -327,63 +393,81 @@ class Device(object):
         if len(dict_io) <= 0:
             return slice(0, 0)
 
+        # Häufig verwendete Attribute für die Schleife lokal binden, die
+        # Prozessabbildlänge relativ zum Device für den Adressvergleich
+        modio_length = self._modio.length - self._offset
+        register_io = self._modio.io._private_register_new_io_object
+
+        # Geräteeigenschaften ändern sich nicht pro IO
+        is_ro = isinstance(self, RoModule)
+        is_gateway = isinstance(self, Gateway)
+        lst_counter = self._lst_counter if isinstance(self, DioModule) else ()
+        # Bei AIO (103) signed auf True setzen
+        signed = self._producttype == ProductType.AIO
+
+        lst_ignored = []
         int_min, int_max = PROCESS_IMAGE_SIZE, 0
-        for key in sorted(dict_io, key=lambda x: int(x)):
+        for key in sorted(dict_io, key=int):
+            lst_io = dict_io[key]
+
             # Neuen IO anlegen
             if iotype == MEM:
                 # Memory setting
-                io_new = MemIO(self, dict_io[key], iotype, "little", False)
-            elif isinstance(self, RoModule) and dict_io[key][3] == "1":
+                io_new = MemIO(self, lst_io, iotype, "little", False)
+            elif is_ro and lst_io[3] == "1":
                 # Relais of RO are on device address "1" and has a cycle counter
-                if dict_io[key][7]:
+                if lst_io[7]:
                     # Each relais output has a single bit
-                    io_new = RelaisOutput(self, dict_io[key], iotype, "little", False)
+                    io_new = RelaisOutput(self, lst_io, iotype, "little", False)
                 else:
                     # All relais outputs are in one byte
-                    io_new = IntRelaisOutput(self, dict_io[key], iotype, "little", False)
+                    io_new = IntRelaisOutput(self, lst_io, iotype, "little", False)
 
-            elif bool(dict_io[key][7]):
+            elif lst_io[7]:
                 # Bei Bitwerten IOBase verwenden
-                io_new = IOBase(self, dict_io[key], iotype, "little", False)
-            elif isinstance(self, DioModule) and dict_io[key][3] in self._lst_counter:
+                io_new = IOBase(self, lst_io, iotype, "little", False)
+            elif lst_io[3] in lst_counter:
                 # Counter IO auf einem DI oder DIO
                 io_new = IntIOCounter(
-                    self._lst_counter.index(dict_io[key][3]),
+                    lst_counter.index(lst_io[3]),
                     self,
-                    dict_io[key],
+                    lst_io,
                     iotype,
                     "little",
                     False,
                 )
-            elif isinstance(self, Gateway):
+            elif is_gateway:
                 # Ersetzbare IOs erzeugen
-                io_new = IntIOReplaceable(self, dict_io[key], iotype, "little", False)
+                io_new = IntIOReplaceable(self, lst_io, iotype, "little", False)
             else:
-                io_new = IntIO(
-                    self,
-                    dict_io[key],
-                    iotype,
-                    "little",
-                    # Bei AIO (103) signed auf True setzen
-                    self._producttype == ProductType.AIO,
-                )
+                io_new = IntIO(self, lst_io, iotype, "little", signed)
 
-            if io_new.address < self._modio.length:
-                warnings.warn(
-                    "IO {0} is not in the device offset and will be ignored".format(io_new.name),
-                    Warning,
-                )
+            slc_address = io_new._slc_address
+            if slc_address.start < modio_length:
+                # Warnung erst nach der Schleife für alle IOs gemeinsam
+                lst_ignored.append(io_new._name)
             else:
                 # IO registrieren
-                self._modio.io._private_register_new_io_object(io_new)
+                register_io(io_new)
 
             # Kleinste und größte Speicheradresse ermitteln
-            if io_new._slc_address.start < int_min:
-                int_min = io_new._slc_address.start
-            if io_new._slc_address.stop > int_max:
-                int_max = io_new._slc_address.stop
+            if slc_address.start < int_min:
+                int_min = slc_address.start
+            if slc_address.stop > int_max:
+                int_max = slc_address.stop
+
+        if len(lst_ignored) == 1:
+            warnings.warn(
+                "IO {0} is not in the device offset and will be ignored".format(lst_ignored[0]),
+                Warning,
+            )
+        elif lst_ignored:
+            warnings.warn(
+                "IOs {0} are not in the device offset and will be ignored"
+                "".format(", ".join(lst_ignored)),
+                Warning,
+            )
 
-        self._ba_devdata += bytearray(int_max - int_min)
         return slice(int_min, int_max)
 
     def _devconfigure(self):
@@ -407,8 +491,22 @@ class Device(object):
         return self._producttype
 
     def _update_my_io_list(self) -> None:
-        """Erzeugt eine neue IO Liste fuer schnellen Zugriff."""
-        self.__my_io_list = list(self.__iter__())
+        """Erzeugt neue IO Listen fuer schnellen Zugriff."""
+        io_bytes = self._modio.io
+
+        def ios_in(slc: slice) -> list:
+            # Liste direkt erzeugen, ohne Umweg über den Generator
+            return [io for lst_io in io_bytes[slc] for io in lst_io if io is not None]
+
+        self.__my_io_list = ios_in(self._slc_devoff)
+        self.__my_allios = tuple(ios_in(self._slc_iooff))
+        self.__my_inputs = tuple(ios_in(self._slc_inpoff))
+        self.__my_outputs = tuple(ios_in(self._slc_outoff))
+        self.__my_memories = tuple(ios_in(self._slc_memoff))
+
+        # Namen und Adressen für __contains__
+        self.__my_io_names = frozenset(io._name for io in self.__my_io_list)
+        self.__my_io_addresses = frozenset(io.address for io in self.__my_io_list)
 
     def autorefresh(self, activate=True) -> None:
         """
@@ -416,13 +514,14 @@ class Device(object):
 
         :param activate: Default True fuegt Device zur Synchronisierung hinzu
         """
-        if activate and self not in self._modio._lst_refresh:
+        # _selfupdate ist genau dann True, wenn das Device in _lst_refresh ist
+        if activate and not self._selfupdate:
             # Daten bei Aufnahme direkt einlesen!
             self._modio.readprocimg(self)
 
             # Datenkopie anlegen
             with self._filelock:
-                self._ba_datacp = self._ba_devdata[:]
+                self._ba_datacp[:] = self._ba_devdata
 
             self._selfupdate = True
 
@@ -440,7 +539,7 @@ class Device(object):
                 self._modio._imgwriter.refresh = imgrefresh
                 self._modio._imgwriter.start()
 
-        elif not activate and self in self._modio._lst_refresh:
+        elif not activate and self._selfupdate:
             # Sicher aus Liste entfernen
             with self._modio._imgwriter.lck_refresh:
                 self._modio._lst_refresh.remove(self)
@@ -466,7 +565,7 @@ class Device(object):
         :param export: Nur In-/Outputs mit angegebenen 'Export' Wert in piCtory
         :return: <class 'list'> Input und Output, keine MEMs
         """
-        return list(self.__getioiter(slice(self._slc_inpoff.start, self._slc_outoff.stop), export))
+        return self.__filter_export(self.__my_allios, export)
 
     def get_inputs(self, export=None) -> list:
         """
@@ -479,7 +578,7 @@ class Device(object):
         :param export: Nur Inputs mit angegebenen 'Export' Wert in piCtory
         :return: <class 'list'> Inputs
         """
-        return list(self.__getioiter(self._slc_inpoff, export))
+        return self.__filter_export(self.__my_inputs, export)
 
     def get_outputs(self, export=None) -> list:
         """
@@ -492,7 +591,7 @@ class Device(object):
         :param export: Nur Outputs mit angegebenen 'Export' Wert in piCtory
         :return: <class 'list'> Outputs
         """
-        return list(self.__getioiter(self._slc_outoff, export))
+        return self.__filter_export(self.__my_outputs, export)
 
     def get_memories(self, export=None) -> list:
         """
@@ -505,7 +604,7 @@ class Device(object):
         :param export: Nur Mems mit angegebenen 'Export' Wert in piCtory
         :return: <class 'list'> Mems
         """
-        return list(self.__getioiter(self._slc_memoff, export))
+        return self.__filter_export(self.__my_memories, export)
 
     def readprocimg(self) -> bool:
         """
@@ -568,27 +667,62 @@ class Base(Device):
 
     __slots__ = ()
 
-    pass
+    def _write_led_bits(self, ios: tuple, index: int, mask: int, bits: int) -> None:
+        """
+        Schreibt mehrere LED Bits mit einem Zugriff in ein Byte.
 
+        Die IO-Objekte der Bits werden bei shared_procimg zum Schreiben
+        vorgemerkt, wie es IOBase.set_value() fuer jedes Bit machen wuerde.
 
-class GatewayMixin:
-    @property
-    def leftgate(self) -> bool:
+        :param ios: IO-Objekte der geschriebenen Bits
+        :param index: Byteadresse im Device
+        :param mask: Bitmaske der LED im Byte
+        :param bits: Neue Bits der LED innerhalb der Bitmaske
         """
-        Statusbit links vom RevPi ist ein piGate Modul angeschlossen.
+        with self._filelock:
+            if self._shared_procimg:
+                self._shared_write.update(ios)
+            self._ba_devdata[index] = self._ba_devdata[index] & ~mask | bits
 
-        :return: True, wenn piGate links existiert
+    def _toggle_bit(self, io: IOBase) -> None:
         """
-        return bool(int.from_bytes(self._ba_devdata[self._slc_statusbyte], byteorder="little") & 16)
+        Invertiert das Bit eines IO-Objekts direkt im Byte.
 
-    @property
-    def rightgate(self) -> bool:
+        :param io: IO-Objekt mit Bitadresse
         """
-        Statusbit rechts vom RevPi ist ein piGate Modul angeschlossen.
+        with self._filelock:
+            if self._shared_procimg:
+                self._shared_write.add(io)
+            self._ba_devdata[io._slc_address.start] ^= io._bitshift
 
-        :return: True, wenn piGate rechts existiert
-        """
-        return bool(int.from_bytes(self._ba_devdata[self._slc_statusbyte], byteorder="little") & 32)
+
+class ProtectedIOMixin:
+    """Verhindert die Ueberschreibung der festen IOs eines Devices."""
+
+    __slots__ = ()
+
+    # IOs die nicht direkt überschrieben werden dürfen
+    _protected_ios = frozenset()
+
+    def __setattr__(self, key, value):
+        """Verhindert Ueberschreibung der speziellen IOs."""
+        if key in self._protected_ios and hasattr(self, key):
+            raise AttributeError("direct assignment is not supported - use .value Attribute")
+        object.__setattr__(self, key, value)
+
+
+class GatewayMixin:
+    leftgate = _statusbit(
+        16,
+        "Statusbit links vom RevPi ist ein piGate Modul angeschlossen.\n\n"
+        ":return: True, wenn piGate links existiert",
+    )
+
+    rightgate = _statusbit(
+        32,
+        "Statusbit rechts vom RevPi ist ein piGate Modul angeschlossen.\n\n"
+        ":return: True, wenn piGate rechts existiert",
+    )
 
 
 class ModularBase(Base):
@@ -599,6 +733,7 @@ class ModularBase(Base):
     """
 
     __slots__ = (
+        "_led_start",
         "_slc_cycle",
         "_slc_errorcnt",
         "_slc_statusbyte",
@@ -616,10 +751,11 @@ class ModularBase(Base):
         :param slc_io: Byte Slice vom ErrorLimit
         :return: Aktuellen ErrorLimit oder None wenn nicht verfuegbar
         """
-        if 0 <= errorlimit <= 65535:
-            self._ba_devdata[slc_io] = errorlimit.to_bytes(2, byteorder="little")
-        else:
+        if not isinstance(errorlimit, int):
+            raise TypeError("errorlimit value must be <class 'int'>")
+        if not 0 <= errorlimit <= 65535:
             raise ValueError("errorlimit value must be between 0 and 65535")
+        _pack_u16_into(self._ba_devdata, slc_io.start, errorlimit)
 
     def _get_status(self) -> int:
         """
@@ -627,43 +763,31 @@ class ModularBase(Base):
 
         :return: Status als <class 'int'>
         """
-        return int.from_bytes(self._ba_devdata[self._slc_statusbyte], byteorder="little")
-
-    @property
-    def picontrolrunning(self) -> bool:
-        """
-        Statusbit fuer piControl-Treiber laeuft.
+        return self._ba_devdata[self._slc_statusbyte.start]
 
-        :return: True, wenn Treiber laeuft
-        """
-        return bool(int.from_bytes(self._ba_devdata[self._slc_statusbyte], byteorder="little") & 1)
-
-    @property
-    def unconfdevice(self) -> bool:
-        """
-        Statusbit fuer ein IO-Modul nicht mit PiCtory konfiguriert.
-
-        :return: True, wenn IO Modul nicht konfiguriert
-        """
-        return bool(int.from_bytes(self._ba_devdata[self._slc_statusbyte], byteorder="little") & 2)
-
-    @property
-    def missingdeviceorgate(self) -> bool:
-        """
-        Statusbit fuer ein IO-Modul fehlt oder piGate konfiguriert.
+    picontrolrunning = _statusbit(
+        1,
+        "Statusbit fuer piControl-Treiber laeuft.\n\n"
+        ":return: True, wenn Treiber laeuft",
+    )
 
-        :return: True, wenn IO-Modul fehlt oder piGate konfiguriert
-        """
-        return bool(int.from_bytes(self._ba_devdata[self._slc_statusbyte], byteorder="little") & 4)
+    unconfdevice = _statusbit(
+        2,
+        "Statusbit fuer ein IO-Modul nicht mit PiCtory konfiguriert.\n\n"
+        ":return: True, wenn IO Modul nicht konfiguriert",
+    )
 
-    @property
-    def overunderflow(self) -> bool:
-        """
-        Statusbit Modul belegt mehr oder weniger Speicher als konfiguriert.
+    missingdeviceorgate = _statusbit(
+        4,
+        "Statusbit fuer ein IO-Modul fehlt oder piGate konfiguriert.\n\n"
+        ":return: True, wenn IO-Modul fehlt oder piGate konfiguriert",
+    )
 
-        :return: True, wenn falscher Speicher belegt ist
-        """
-        return bool(int.from_bytes(self._ba_devdata[self._slc_statusbyte], byteorder="little") & 8)
+    overunderflow = _statusbit(
+        8,
+        "Statusbit Modul belegt mehr oder weniger Speicher als konfiguriert.\n\n"
+        ":return: True, wenn falscher Speicher belegt ist",
+    )
 
     @property
     def iocycle(self) -> int:
@@ -675,7 +799,7 @@ class ModularBase(Base):
         return (
             -1
             if self._slc_cycle is None
-            else int.from_bytes(self._ba_devdata[self._slc_cycle], byteorder="little")
+            else self._ba_devdata[self._slc_cycle.start]
         )
 
     @property
@@ -688,7 +812,7 @@ class ModularBase(Base):
         return (
             -273
             if self._slc_temperature is None
-            else int.from_bytes(self._ba_devdata[self._slc_temperature], byteorder="little")
+            else self._ba_devdata[self._slc_temperature.start]
         )
 
     @property
@@ -701,7 +825,7 @@ class ModularBase(Base):
         return (
             -1
             if self._slc_frequency is None
-            else int.from_bytes(self._ba_devdata[self._slc_frequency], byteorder="little") * 10
+            else self._ba_devdata[self._slc_frequency.start] * 10
         )
 
     @property
@@ -714,7 +838,7 @@ class ModularBase(Base):
         return (
             -1
             if self._slc_errorcnt is None
-            else int.from_bytes(self._ba_devdata[self._slc_errorcnt], byteorder="little")
+            else _unpack_u16_from(self._ba_devdata, self._slc_errorcnt.start)[0]
         )
 
     @property
@@ -727,7 +851,7 @@ class ModularBase(Base):
         return (
             -1
             if self._slc_errorlimit1 is None
-            else int.from_bytes(self._ba_devdata[self._slc_errorlimit1], byteorder="little")
+            else _unpack_u16_from(self._ba_devdata, self._slc_errorlimit1.start)[0]
         )
 
     @errorlimit1.setter
@@ -752,7 +876,7 @@ class ModularBase(Base):
         return (
             -1
             if self._slc_errorlimit2 is None
-            else int.from_bytes(self._ba_devdata[self._slc_errorlimit2], byteorder="little")
+            else _unpack_u16_from(self._ba_devdata, self._slc_errorlimit2.start)[0]
         )
 
     @errorlimit2.setter
@@ -770,7 +894,7 @@ class ModularBase(Base):
     status = property(_get_status)
 
 
-class Core(ModularBase, GatewayMixin):
+class Core(ModularBase, ProtectedIOMixin, GatewayMixin):
     """
     Klasse fuer den RevPi Core.
 
@@ -779,12 +903,8 @@ class Core(ModularBase, GatewayMixin):
 
     __slots__ = "a1green", "a1red", "a2green", "a2red", "wd"
 
-    def __setattr__(self, key, value):
-        """Verhindert Ueberschreibung der LEDs."""
-        if hasattr(self, key) and key in ("a1green", "a1red", "a2green", "a2red", "wd"):
-            raise AttributeError("direct assignment is not supported - use .value Attribute")
-        else:
-            object.__setattr__(self, key, value)
+    # IOs die nicht direkt überschrieben werden dürfen
+    _protected_ios = frozenset(("a1green", "a1red", "a2green", "a2red", "wd"))
 
     def _devconfigure(self) -> None:
         """Core-Klasse vorbereiten."""
@@ -817,9 +937,11 @@ class Core(ModularBase, GatewayMixin):
             self._slc_led = slice(6, 7)
             self._slc_errorlimit1 = slice(7, 9)
             self._slc_errorlimit2 = slice(9, 11)
+        self._led_start = self._slc_led.start
 
         # Exportflags prüfen (Byte oder Bit)
-        lst_led = self._modio.io[self._slc_devoff][self._slc_led.start]
+        lst_myios = self._modio.io[self._slc_devoff]
+        lst_led = lst_myios[self._slc_led.start]
         if len(lst_led) == 8:
             exp_a1green = lst_led[0].export
             exp_a1red = lst_led[1].export
@@ -834,28 +956,28 @@ class Core(ModularBase, GatewayMixin):
         # Echte IOs erzeugen
         self.a1green = IOBase(
             self,
-            ["core.a1green", 0, 1, self._slc_led.start, exp_a1green, None, "LED_A1_GREEN", "0"],
+            ("core.a1green", 0, 1, self._slc_led.start, exp_a1green, None, "LED_A1_GREEN", "0"),
             OUT,
             "little",
             False,
         )
         self.a1red = IOBase(
             self,
-            ["core.a1red", 0, 1, self._slc_led.start, exp_a1red, None, "LED_A1_RED", "1"],
+            ("core.a1red", 0, 1, self._slc_led.start, exp_a1red, None, "LED_A1_RED", "1"),
             OUT,
             "little",
             False,
         )
         self.a2green = IOBase(
             self,
-            ["core.a2green", 0, 1, self._slc_led.start, exp_a2green, None, "LED_A2_GREEN", "2"],
+            ("core.a2green", 0, 1, self._slc_led.start, exp_a2green, None, "LED_A2_GREEN", "2"),
             OUT,
             "little",
             False,
         )
         self.a2red = IOBase(
             self,
-            ["core.a2red", 0, 1, self._slc_led.start, exp_a2red, None, "LED_A2_RED", "3"],
+            ("core.a2red", 0, 1, self._slc_led.start, exp_a2red, None, "LED_A2_RED", "3"),
             OUT,
             "little",
             False,
@@ -864,7 +986,7 @@ class Core(ModularBase, GatewayMixin):
         # Watchdog einrichten (Core=soft / Connect=soft/hard)
         self.wd = IOBase(
             self,
-            ["core.wd", 0, 1, self._slc_led.start, False, None, "WatchDog", "7"],
+            ("core.wd", 0, 1, self._slc_led.start, False, None, "WatchDog", "7"),
             OUT,
             "little",
             False,
@@ -877,7 +999,7 @@ class Core(ModularBase, GatewayMixin):
         :return: 0=aus, 1=gruen, 2=rot
         """
         # 0b00000011 = 3
-        return self._ba_devdata[self._slc_led.start] & 3
+        return self._ba_devdata[self._led_start] & 3
 
     def _get_leda2(self) -> int:
         """
@@ -886,7 +1008,7 @@ class Core(ModularBase, GatewayMixin):
         :return: 0=aus, 1=gruen, 2=rot
         """
         # 0b00001100 = 12
-        return (self._ba_devdata[self._slc_led.start] & 12) >> 2
+        return (self._ba_devdata[self._led_start] & 12) >> 2
 
     def _set_leda1(self, value: int) -> None:
         """
@@ -895,8 +1017,7 @@ class Core(ModularBase, GatewayMixin):
         :param value: 0=aus, 1=gruen, 2=rot
         """
         if 0 <= value <= 3:
-            self.a1green(bool(value & 1))
-            self.a1red(bool(value & 2))
+            self._write_led_bits((self.a1green, self.a1red), self._led_start, 3, value)
         else:
             raise ValueError("led status must be between 0 and 3")
 
@@ -907,14 +1028,13 @@ class Core(ModularBase, GatewayMixin):
         :param value: 0=aus, 1=gruen, 2=rot
         """
         if 0 <= value <= 3:
-            self.a2green(bool(value & 1))
-            self.a2red(bool(value & 2))
+            self._write_led_bits((self.a2green, self.a2red), self._led_start, 12, value << 2)
         else:
             raise ValueError("led status must be between 0 and 3")
 
     def wd_toggle(self):
         """Toggle watchdog bit to prevent a timeout."""
-        self.wd.value = not self.wd.value
+        self._toggle_bit(self.wd)
 
     A1 = property(_get_leda1, _set_leda1)
     A2 = property(_get_leda2, _set_leda2)
@@ -928,16 +1048,13 @@ class Connect(Core):
 
     __slots__ = "__evt_wdtoggle", "__th_wdtoggle", "a3green", "a3red", "x2in", "x2out"
 
-    def __setattr__(self, key, value):
-        """Verhindert Ueberschreibung der speziellen IOs."""
-        if hasattr(self, key) and key in ("a3green", "a3red", "x2in", "x2out"):
-            raise AttributeError("direct assignment is not supported - use .value Attribute")
-        super(Connect, self).__setattr__(key, value)
+    # IOs die nicht direkt überschrieben werden dürfen
+    _protected_ios = Core._protected_ios | frozenset(("a3green", "a3red", "x2in", "x2out"))
 
     def __wdtoggle(self) -> None:
         """WD Ausgang alle 10 Sekunden automatisch toggeln."""
         while not self.__evt_wdtoggle.wait(10):
-            self.wd.value = not self.wd.value
+            self.wd_toggle()
 
     def _devconfigure(self) -> None:
         """Connect-Klasse vorbereiten."""
@@ -968,14 +1085,14 @@ class Connect(Core):
         # Echte IOs erzeugen
         self.a3green = IOBase(
             self,
-            ["core.a3green", 0, 1, self._slc_led.start, exp_a3green, None, "LED_A3_GREEN", "4"],
+            ("core.a3green", 0, 1, self._slc_led.start, exp_a3green, None, "LED_A3_GREEN", "4"),
             OUT,
             "little",
             False,
         )
         self.a3red = IOBase(
             self,
-            ["core.a3red", 0, 1, self._slc_led.start, exp_a3red, None, "LED_A3_RED", "5"],
+            ("core.a3red", 0, 1, self._slc_led.start, exp_a3red, None, "LED_A3_RED", "5"),
             OUT,
             "little",
             False,
@@ -984,21 +1101,22 @@ class Connect(Core):
         # IO Objekte für WD und X2 in/out erzeugen
         self.x2in = IOBase(
             self,
-            ["core.x2in", 0, 1, self._slc_statusbyte.start, exp_x2in, None, "Connect_X2_IN", "6"],
+            ("core.x2in", 0, 1, self._slc_statusbyte.start, exp_x2in, None, "Connect_X2_IN", "6"),
             INP,
             "little",
             False,
         )
         self.x2out = IOBase(
             self,
-            ["core.x2out", 0, 1, self._slc_led.start, exp_x2out, None, "Connect_X2_OUT", "6"],
+            ("core.x2out", 0, 1, self._slc_led.start, exp_x2out, None, "Connect_X2_OUT", "6"),
             OUT,
             "little",
             False,
         )
 
         # Export hardware watchdog to use it with other systems
-        self.wd._export = int(exp_wd)  # Do this without mrk for export!
+        # Set the flag directly as 0 or 1, the export property would add the change mark
+        self.wd._export = int(exp_wd)
 
     def _get_leda3(self) -> int:
         """
@@ -1007,7 +1125,7 @@ class Connect(Core):
         :return: 0=aus, 1=gruen, 2=rot
         """
         # 0b00110000 = 48
-        return (self._ba_devdata[self._slc_led.start] & 48) >> 4
+        return (self._ba_devdata[self._led_start] & 48) >> 4
 
     def _get_wdtoggle(self) -> bool:
         """
@@ -1024,8 +1142,7 @@ class Connect(Core):
         :param: value 0=aus, 1=gruen, 2=rot
         """
         if 0 <= value <= 3:
-            self.a3green(bool(value & 1))
-            self.a3red(bool(value & 2))
+            self._write_led_bits((self.a3green, self.a3red), self._led_start, 48, value << 4)
         else:
             raise ValueError("led status must be between 0 and 3")
 
@@ -1062,7 +1179,7 @@ class Connect(Core):
     wdautotoggle = property(_get_wdtoggle, _set_wdtoggle)
 
 
-class ModularBaseConnect_4_5(ModularBase):
+class ModularBaseConnect_4_5(ModularBase, ProtectedIOMixin):
     """Class for overlapping functions of Connect 4/5."""
 
     __slots__ = (
@@ -1084,9 +1201,9 @@ class ModularBaseConnect_4_5(ModularBase):
         "a5blue",
     )
 
-    def __setattr__(self, key, value):
-        """Verhindert Ueberschreibung der speziellen IOs."""
-        if hasattr(self, key) and key in (
+    # IOs die nicht direkt überschrieben werden dürfen
+    _protected_ios = frozenset(
+        (
             "a1red",
             "a1green",
             "a1blue",
@@ -1102,22 +1219,12 @@ class ModularBaseConnect_4_5(ModularBase):
             "a5red",
             "a5green",
             "a5blue",
-        ):
-            raise AttributeError("direct assignment is not supported - use .value Attribute")
-        super().__setattr__(key, value)
-
-    def __led_calculator(self, led_value: int) -> int:
-        """
-        Calculate the LED value of Connect 4/5.
+        )
+    )
 
-        Only the Connect 4/5 have swapped LED colors red and green. We have to recalculate that
-        values to match our values for GREEN, RED and BLUE.
-        """
-        led_calculated = led_value & 0b001
-        led_calculated <<= 1
-        led_calculated += bool(led_value & 0b010)
-        led_calculated += led_value & 0b100
-        return led_calculated
+    # Only the Connect 4/5 have swapped LED colors red and green. This table maps the 3 bit
+    # value of the process image to our values for GREEN, RED and BLUE (swap bit 0 and 1).
+    __led_swap = (0, 2, 1, 3, 4, 6, 5, 7)
 
     def _devconfigure(self) -> None:
         """Connect 4/5-Klasse vorbereiten."""
@@ -1132,6 +1239,7 @@ class ModularBaseConnect_4_5(ModularBase):
         self._slc_errorlimit1 = slice(7, 9)
         self._slc_errorlimit2 = slice(9, 11)
         self._slc_led = slice(11, 13)
+        self._led_start = self._slc_led.start
 
         # Exportflags prüfen (Byte oder Bit)
         lst_myios = self._modio.io[self._slc_devoff]
@@ -1139,148 +1247,35 @@ class ModularBaseConnect_4_5(ModularBase):
         lst_output = lst_myios[self._slc_output.start]
 
         if len(lst_led) == 16:
-            exp_a1red = lst_led[0].export
-            exp_a1green = lst_led[1].export
-            exp_a1blue = lst_led[2].export
-            exp_a2red = lst_led[3].export
-            exp_a2green = lst_led[4].export
-            exp_a2blue = lst_led[5].export
-            exp_a3red = lst_led[6].export
-            exp_a3green = lst_led[7].export
-            exp_a3blue = lst_led[8].export
-            exp_a4red = lst_led[9].export
-            exp_a4green = lst_led[10].export
-            exp_a4blue = lst_led[11].export
-            exp_a5red = lst_led[12].export
-            exp_a5green = lst_led[13].export
-            exp_a5blue = lst_led[14].export
+            tup_export = tuple(io.export for io in lst_led[:15])
         else:
-            exp_a1red = lst_led[0].export
-            exp_a1green = exp_a1red
-            exp_a1blue = exp_a1red
-            exp_a2red = exp_a1red
-            exp_a2green = exp_a1red
-            exp_a2blue = exp_a1red
-            exp_a3red = exp_a1red
-            exp_a3green = exp_a1red
-            exp_a3blue = exp_a1red
-            exp_a4red = exp_a1red
-            exp_a4green = exp_a1red
-            exp_a4blue = exp_a1red
-            exp_a5red = exp_a1red
-            exp_a5green = exp_a1red
-            exp_a5blue = exp_a1red
-
-        # Echte IOs erzeugen
-        self.a1red = IOBase(
-            self,
-            ["core.a1red", 0, 1, self._slc_led.start, exp_a1red, None, "LED_A1_RED", "0"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a1green = IOBase(
-            self,
-            ["core.a1green", 0, 1, self._slc_led.start, exp_a1green, None, "LED_A1_GREEN", "1"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a1blue = IOBase(
-            self,
-            ["core.a1blue", 0, 1, self._slc_led.start, exp_a1blue, None, "LED_A1_BLUE", "2"],
-            OUT,
-            "little",
-            False,
-        )
+            tup_export = (lst_led[0].export,) * 15
 
-        self.a2red = IOBase(
-            self,
-            ["core.a2red", 0, 1, self._slc_led.start, exp_a2red, None, "LED_A2_RED", "3"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a2green = IOBase(
-            self,
-            ["core.a2green", 0, 1, self._slc_led.start, exp_a2green, None, "LED_A2_GREEN", "4"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a2blue = IOBase(
-            self,
-            ["core.a2blue", 0, 1, self._slc_led.start, exp_a2blue, None, "LED_A2_BLUE", "5"],
-            OUT,
-            "little",
-            False,
-        )
-
-        self.a3red = IOBase(
-            self,
-            ["core.a3red", 0, 1, self._slc_led.start, exp_a3red, None, "LED_A3_RED", "6"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a3green = IOBase(
-            self,
-            ["core.a3green", 0, 1, self._slc_led.start, exp_a3green, None, "LED_A3_GREEN", "7"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a3blue = IOBase(
-            self,
-            ["core.a3blue", 0, 1, self._slc_led.start, exp_a3blue, None, "LED_A3_BLUE", "8"],
-            OUT,
-            "little",
-            False,
-        )
-
-        self.a4red = IOBase(
-            self,
-            ["core.a4red", 0, 1, self._slc_led.start, exp_a4red, None, "LED_A4_RED", "9"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a4green = IOBase(
-            self,
-            ["core.a4green", 0, 1, self._slc_led.start, exp_a4green, None, "LED_A4_GREEN", "10"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a4blue = IOBase(
-            self,
-            ["core.a4blue", 0, 1, self._slc_led.start, exp_a4blue, None, "LED_A4_BLUE", "11"],
-            OUT,
-            "little",
-            False,
-        )
-
-        self.a5red = IOBase(
-            self,
-            ["core.a5red", 0, 1, self._slc_led.start, exp_a5red, None, "LED_A5_RED", "12"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a5green = IOBase(
-            self,
-            ["core.a5green", 0, 1, self._slc_led.start, exp_a5green, None, "LED_A5_GREEN", "13"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a5blue = IOBase(
-            self,
-            ["core.a5blue", 0, 1, self._slc_led.start, exp_a5blue, None, "LED_A5_BLUE", "14"],
-            OUT,
-            "little",
-            False,
-        )
+        # Echte IOs erzeugen (Bit 0 bis 14: a1red, a1green, a1blue, ..., a5blue)
+        int_bit = 0
+        for led in ("a1", "a2", "a3", "a4", "a5"):
+            for color in ("red", "green", "blue"):
+                setattr(
+                    self,
+                    led + color,
+                    IOBase(
+                        self,
+                        (
+                            "core." + led + color,
+                            0,
+                            1,
+                            self._slc_led.start,
+                            tup_export[int_bit],
+                            None,
+                            "LED_{0}_{1}".format(led.upper(), color.upper()),
+                            str(int_bit),
+                        ),
+                        OUT,
+                        "little",
+                        False,
+                    ),
+                )
+                int_bit += 1
 
     def _get_leda1(self) -> int:
         """
@@ -1288,7 +1283,7 @@ class ModularBaseConnect_4_5(ModularBase):
 
         :return: 0=aus, 1=gruen, 2=root, 4=blau, mixed RGB colors
         """
-        return self.__led_calculator(self._ba_devdata[self._slc_led.start] & 0b00000111)
+        return self.__led_swap[self._ba_devdata[self._led_start] & 0b00000111]
 
     def _get_leda2(self) -> int:
         """
@@ -1296,7 +1291,7 @@ class ModularBaseConnect_4_5(ModularBase):
 
         :return: 0=aus, 1=gruen, 2=root, 4=blau, mixed RGB colors
         """
-        return self.__led_calculator((self._ba_devdata[self._slc_led.start] & 0b00111000) >> 3)
+        return self.__led_swap[(self._ba_devdata[self._led_start] & 0b00111000) >> 3]
 
     def _get_leda3(self) -> int:
         """
@@ -1304,8 +1299,9 @@ class ModularBaseConnect_4_5(ModularBase):
 
         :return: 0=aus, 1=gruen, 2=root, 4=blau, mixed RGB colors
         """
-        word_led = self._ba_devdata[self._slc_led]
-        return self.__led_calculator((unpack("<H", word_led)[0] & 0b0000000111000000) >> 6)
+        # Bit 6 und 7 vom ersten Byte, Bit 0 vom zweiten Byte
+        ba = self._ba_devdata
+        return self.__led_swap[(ba[self._led_start] >> 6 | ba[self._led_start + 1] << 2) & 0b111]
 
     def _get_leda4(self) -> int:
         """
@@ -1313,7 +1309,7 @@ class ModularBaseConnect_4_5(ModularBase):
 
         :return: 0=aus, 1=gruen, 2=root, 4=blau, mixed RGB colors
         """
-        return self.__led_calculator((self._ba_devdata[self._slc_led.start + 1] & 0b00001110) >> 1)
+        return self.__led_swap[(self._ba_devdata[self._led_start + 1] & 0b00001110) >> 1]
 
     def _get_leda5(self) -> int:
         """
@@ -1321,7 +1317,7 @@ class ModularBaseConnect_4_5(ModularBase):
 
         :return: 0=aus, 1=gruen, 2=root, 4=blau, mixed RGB colors
         """
-        return self.__led_calculator((self._ba_devdata[self._slc_led.start + 1] & 0b01110000) >> 4)
+        return self.__led_swap[(self._ba_devdata[self._led_start + 1] & 0b01110000) >> 4]
 
     def _set_leda1(self, value: int) -> None:
         """
@@ -1330,9 +1326,12 @@ class ModularBaseConnect_4_5(ModularBase):
         :param: value 0=aus, 1=gruen, 2=rot, 4=blue, mixed RGB colors
         """
         if 0 <= value <= 7:
-            self.a1red(bool(value & 2))
-            self.a1green(bool(value & 1))
-            self.a1blue(bool(value & 4))
+            self._write_led_bits(
+                (self.a1red, self.a1green, self.a1blue),
+                self._led_start,
+                0b00000111,
+                self.__led_swap[value],
+            )
         else:
             raise ValueError("led status must be between 0 and 7")
 
@@ -1343,9 +1342,12 @@ class ModularBaseConnect_4_5(ModularBase):
         :param: value 0=aus, 1=gruen, 2=rot, 4=blue, mixed RGB colors
         """
         if 0 <= value <= 7:
-            self.a2red(bool(value & 2))
-            self.a2green(bool(value & 1))
-            self.a2blue(bool(value & 4))
+            self._write_led_bits(
+                (self.a2red, self.a2green, self.a2blue),
+                self._led_start,
+                0b00111000,
+                self.__led_swap[value] << 3,
+            )
         else:
             raise ValueError("led status must be between 0 and 7")
 
@@ -1356,9 +1358,14 @@ class ModularBaseConnect_4_5(ModularBase):
         :param: value 0=aus, 1=gruen, 2=rot, 4=blue, mixed RGB colors
         """
         if 0 <= value <= 7:
-            self.a3red(bool(value & 2))
-            self.a3green(bool(value & 1))
-            self.a3blue(bool(value & 4))
+            # Bit 6 und 7 vom ersten Byte, Bit 0 vom zweiten Byte unter einem Lock
+            value = self.__led_swap[value]
+            with self._filelock:
+                if self._shared_procimg:
+                    self._shared_write.update((self.a3red, self.a3green, self.a3blue))
+                ba = self._ba_devdata
+                ba[self._led_start] = ba[self._led_start] & 0b00111111 | (value & 0b011) << 6
+                ba[self._led_start + 1] = ba[self._led_start + 1] & 0b11111110 | value >> 2
         else:
             raise ValueError("led status must be between 0 and 7")
 
@@ -1369,9 +1376,12 @@ class ModularBaseConnect_4_5(ModularBase):
         :param: value 0=aus, 1=gruen, 2=rot, 4=blue, mixed RGB colors
         """
         if 0 <= value <= 7:
-            self.a4red(bool(value & 2))
-            self.a4green(bool(value & 1))
-            self.a4blue(bool(value & 4))
+            self._write_led_bits(
+                (self.a4red, self.a4green, self.a4blue),
+                self._led_start + 1,
+                0b00001110,
+                self.__led_swap[value] << 1,
+            )
         else:
             raise ValueError("led status must be between 0 and 7")
 
@@ -1382,9 +1392,12 @@ class ModularBaseConnect_4_5(ModularBase):
         :param: value 0=aus, 1=gruen, 2=rot, 4=blue, mixed RGB colors
         """
         if 0 <= value <= 7:
-            self.a5red(bool(value & 2))
-            self.a5green(bool(value & 1))
-            self.a5blue(bool(value & 4))
+            self._write_led_bits(
+                (self.a5red, self.a5green, self.a5blue),
+                self._led_start + 1,
+                0b01110000,
+                self.__led_swap[value] << 4,
+            )
         else:
             raise ValueError("led status must be between 0 and 7")
 
@@ -1422,14 +1435,8 @@ class Connect4(ModularBaseConnect_4_5):
         "x2out",
     )
 
-    def __setattr__(self, key, value):
-        """Verhindert Ueberschreibung der speziellen IOs."""
-        if hasattr(self, key) and key in (
-            "x2in",
-            "x2out",
-        ):
-            raise AttributeError("direct assignment is not supported - use .value Attribute")
-        super().__setattr__(key, value)
+    # IOs die nicht direkt überschrieben werden dürfen
+    _protected_ios = ModularBaseConnect_4_5._protected_ios | frozenset(("x2in", "x2out"))
 
     def _devconfigure(self) -> None:
         """Connect4-Klasse vorbereiten."""
@@ -1454,21 +1461,21 @@ class Connect4(ModularBaseConnect_4_5):
         # IO Objekte für X2 in/out erzeugen
         self.x2in = IOBase(
             self,
-            ["core.x2in", 0, 1, self._slc_statusbyte.start, exp_x2in, None, "Connect_X2_IN", "6"],
+            ("core.x2in", 0, 1, self._slc_statusbyte.start, exp_x2in, None, "Connect_X2_IN", "6"),
             INP,
             "little",
             False,
         )
         self.x2out = IOBase(
             self,
-            ["core.x2out", 0, 1, self._slc_output.start, exp_x2out, None, "Connect_X2_OUT", "0"],
+            ("core.x2out", 0, 1, self._slc_output.start, exp_x2out, None, "Connect_X2_OUT", "0"),
             OUT,
             "little",
             False,
         )
 
 
-class Compact(Base):
+class Compact(Base, ProtectedIOMixin):
     """
     Klasse fuer den RevPi Compact.
 
@@ -1477,6 +1484,7 @@ class Compact(Base):
     """
 
     __slots__ = (
+        "_led_start",
         "_slc_temperature",
         "_slc_frequency",
         "_slc_led",
@@ -1487,12 +1495,8 @@ class Compact(Base):
         "wd",
     )
 
-    def __setattr__(self, key, value):
-        """Verhindert Ueberschreibung der LEDs."""
-        if hasattr(self, key) and key in ("a1green", "a1red", "a2green", "a2red", "wd"):
-            raise AttributeError("direct assignment is not supported - use .value Attribute")
-        else:
-            object.__setattr__(self, key, value)
+    # IOs die nicht direkt überschrieben werden dürfen
+    _protected_ios = frozenset(("a1green", "a1red", "a2green", "a2red", "wd"))
 
     def _devconfigure(self) -> None:
         """Core-Klasse vorbereiten."""
@@ -1500,11 +1504,13 @@ class Compact(Base):
 
         # Statische IO Verknüpfungen des Compacts
         self._slc_led = slice(23, 24)
+        self._led_start = self._slc_led.start
         self._slc_temperature = slice(0, 1)
         self._slc_frequency = slice(1, 2)
 
         # Exportflags prüfen (Byte oder Bit)
-        lst_led = self._modio.io[self._slc_devoff][self._slc_led.start]
+        lst_myios = self._modio.io[self._slc_devoff]
+        lst_led = lst_myios[self._slc_led.start]
         if len(lst_led) == 8:
             exp_a1green = lst_led[0].export
             exp_a1red = lst_led[1].export
@@ -1519,28 +1525,28 @@ class Compact(Base):
         # Echte IOs erzeugen
         self.a1green = IOBase(
             self,
-            ["core.a1green", 0, 1, self._slc_led.start, exp_a1green, None, "LED_A1_GREEN", "0"],
+            ("core.a1green", 0, 1, self._slc_led.start, exp_a1green, None, "LED_A1_GREEN", "0"),
             OUT,
             "little",
             False,
         )
         self.a1red = IOBase(
             self,
-            ["core.a1red", 0, 1, self._slc_led.start, exp_a1red, None, "LED_A1_RED", "1"],
+            ("core.a1red", 0, 1, self._slc_led.start, exp_a1red, None, "LED_A1_RED", "1"),
             OUT,
             "little",
             False,
         )
         self.a2green = IOBase(
             self,
-            ["core.a2green", 0, 1, self._slc_led.start, exp_a2green, None, "LED_A2_GREEN", "2"],
+            ("core.a2green", 0, 1, self._slc_led.start, exp_a2green, None, "LED_A2_GREEN", "2"),
             OUT,
             "little",
             False,
         )
         self.a2red = IOBase(
             self,
-            ["core.a2red", 0, 1, self._slc_led.start, exp_a2red, None, "LED_A2_RED", "3"],
+            ("core.a2red", 0, 1, self._slc_led.start, exp_a2red, None, "LED_A2_RED", "3"),
             OUT,
             "little",
             False,
@@ -1549,7 +1555,7 @@ class Compact(Base):
         # Software watchdog einrichten
         self.wd = IOBase(
             self,
-            ["core.wd", 0, 1, self._slc_led.start, False, None, "WatchDog", "7"],
+            ("core.wd", 0, 1, self._slc_led.start, False, None, "WatchDog", "7"),
             OUT,
             "little",
             False,
@@ -1562,7 +1568,7 @@ class Compact(Base):
         :return: 0=aus, 1=gruen, 2=rot
         """
         # 0b00000011 = 3
-        return self._ba_devdata[self._slc_led.start] & 3
+        return self._ba_devdata[self._led_start] & 3
 
     def _get_leda2(self) -> int:
         """
@@ -1571,7 +1577,7 @@ class Compact(Base):
         :return: 0=aus, 1=gruen, 2=rot
         """
         # 0b00001100 = 12
-        return (self._ba_devdata[self._slc_led.start] & 12) >> 2
+        return (self._ba_devdata[self._led_start] & 12) >> 2
 
     def _set_leda1(self, value: int) -> None:
         """
@@ -1580,8 +1586,7 @@ class Compact(Base):
         :param value: 0=aus, 1=gruen, 2=rot
         """
         if 0 <= value <= 3:
-            self.a1green(bool(value & 1))
-            self.a1red(bool(value & 2))
+            self._write_led_bits((self.a1green, self.a1red), self._led_start, 3, value)
         else:
             raise ValueError("led status must be between 0 and 3")
 
@@ -1592,14 +1597,13 @@ class Compact(Base):
         :param value: 0=aus, 1=gruen, 2=rot
         """
         if 0 <= value <= 3:
-            self.a2green(bool(value & 1))
-            self.a2red(bool(value & 2))
+            self._write_led_bits((self.a2green, self.a2red), self._led_start, 12, value << 2)
         else:
             raise ValueError("led status must be between 0 and 3")
 
     def wd_toggle(self):
         """Toggle watchdog bit to prevent a timeout."""
-        self.wd.value = not self.wd.value
+        self._toggle_bit(self.wd)
 
     A1 = property(_get_leda1, _set_leda1)
     A2 = property(_get_leda2, _set_leda2)
@@ -1609,29 +1613,21 @@ class Compact(Base):
         """
         Gibt CPU-Temperatur zurueck.
 
-        :return: CPU-Temperatur in Celsius (-273 wenn nich verfuegbar)
+        :return: CPU-Temperatur in Celsius
         """
-        return (
-            -273
-            if self._slc_temperature is None
-            else int.from_bytes(self._ba_devdata[self._slc_temperature], byteorder="little")
-        )
+        return self._ba_devdata[self._slc_temperature.start]
 
     @property
     def frequency(self) -> int:
         """
         Gibt CPU Taktfrequenz zurueck.
 
-        :return: CPU Taktfrequenz in MHz (-1 wenn nicht verfuegbar)
+        :return: CPU Taktfrequenz in MHz
         """
-        return (
-            -1
-            if self._slc_frequency is None
-            else int.from_bytes(self._ba_devdata[self._slc_frequency], byteorder="little") * 10
-        )
+        return self._ba_devdata[self._slc_frequency.start] * 10
 
 
-class Flat(Base):
+class Flat(Base, ProtectedIOMixin):
     """
     Klasse fuer den RevPi Flat.
 
@@ -1640,6 +1636,7 @@ class Flat(Base):
     """
 
     __slots__ = (
+        "_led_start",
         "_slc_temperature",
         "_slc_frequency",
         "_slc_led",
@@ -1660,9 +1657,9 @@ class Flat(Base):
         "wd",
     )
 
-    def __setattr__(self, key, value):
-        """Verhindert Ueberschreibung der LEDs."""
-        if hasattr(self, key) and key in (
+    # IOs die nicht direkt überschrieben werden dürfen
+    _protected_ios = frozenset(
+        (
             "a1green",
             "a1red",
             "a2green",
@@ -1676,10 +1673,8 @@ class Flat(Base):
             "relais",
             "switch",
             "wd",
-        ):
-            raise AttributeError("direct assignment is not supported - use .value Attribute")
-        else:
-            object.__setattr__(self, key, value)
+        )
+    )
 
     def _devconfigure(self) -> None:
         """Core-Klasse vorbereiten."""
@@ -1687,128 +1682,66 @@ class Flat(Base):
 
         # Statische IO Verknüpfungen des Compacts
         self._slc_led = slice(7, 9)
+        self._led_start = self._slc_led.start
         self._slc_temperature = slice(4, 5)
         self._slc_frequency = slice(5, 6)
         self._slc_switch = slice(6, 7)
         self._slc_dout = slice(11, 12)
 
         # Exportflags prüfen (Byte oder Bit)
-        lst_led = self._modio.io[self._slc_devoff][self._slc_led.start]
+        lst_myios = self._modio.io[self._slc_devoff]
+        lst_led = lst_myios[self._slc_led.start]
         if len(lst_led) == 8:
-            exp_a1green = lst_led[0].export
-            exp_a1red = lst_led[1].export
-            exp_a2green = lst_led[2].export
-            exp_a2red = lst_led[3].export
-            exp_a3green = lst_led[4].export
-            exp_a3red = lst_led[5].export
-            exp_a4green = lst_led[6].export
-            exp_a4red = lst_led[7].export
-
-            # Next byte
-            lst_led = self._modio.io[self._slc_devoff][self._slc_led.start + 1]
-            exp_a5green = lst_led[0].export
-            exp_a5red = lst_led[1].export
+            # A1 bis A4 im ersten Byte, A5 in den ersten Bits vom nächsten Byte
+            tup_export = tuple(io.export for io in lst_led) + tuple(
+                io.export for io in lst_myios[self._slc_led.start + 1][:2]
+            )
         else:
-            exp_a1green = lst_led[0].export
-            exp_a1red = exp_a1green
-            exp_a2green = exp_a1green
-            exp_a2red = exp_a1green
-            exp_a3green = exp_a1green
-            exp_a3red = exp_a1green
-            exp_a4green = exp_a1green
-            exp_a4red = exp_a1green
-            exp_a5green = exp_a1green
-            exp_a5red = exp_a1green
+            tup_export = (lst_led[0].export,) * 10
 
-        # Echte IOs erzeugen
-        self.a1green = IOBase(
-            self,
-            ["core.a1green", 0, 1, self._slc_led.start, exp_a1green, None, "LED_A1_GREEN", "0"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a1red = IOBase(
-            self,
-            ["core.a1red", 0, 1, self._slc_led.start, exp_a1red, None, "LED_A1_RED", "1"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a2green = IOBase(
-            self,
-            ["core.a2green", 0, 1, self._slc_led.start, exp_a2green, None, "LED_A2_GREEN", "2"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a2red = IOBase(
-            self,
-            ["core.a2red", 0, 1, self._slc_led.start, exp_a2red, None, "LED_A2_RED", "3"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a3green = IOBase(
-            self,
-            ["core.a3green", 0, 1, self._slc_led.start, exp_a3green, None, "LED_A3_GREEN", "4"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a3red = IOBase(
-            self,
-            ["core.a3red", 0, 1, self._slc_led.start, exp_a3red, None, "LED_A3_RED", "5"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a4green = IOBase(
-            self,
-            ["core.a4green", 0, 1, self._slc_led.start, exp_a4green, None, "LED_A4_GREEN", "6"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a4red = IOBase(
-            self,
-            ["core.a4red", 0, 1, self._slc_led.start, exp_a4red, None, "LED_A4_RED", "7"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a5green = IOBase(
-            self,
-            ["core.a5green", 0, 1, self._slc_led.start, exp_a5green, None, "LED_A5_GREEN", "8"],
-            OUT,
-            "little",
-            False,
-        )
-        self.a5red = IOBase(
-            self,
-            ["core.a5red", 0, 1, self._slc_led.start, exp_a5red, None, "LED_A5_RED", "9"],
-            OUT,
-            "little",
-            False,
-        )
+        # Echte IOs erzeugen (Bit 0 bis 9: a1green, a1red, ..., a5green, a5red)
+        int_bit = 0
+        for led in ("a1", "a2", "a3", "a4", "a5"):
+            for color in ("green", "red"):
+                setattr(
+                    self,
+                    led + color,
+                    IOBase(
+                        self,
+                        (
+                            "core." + led + color,
+                            0,
+                            1,
+                            self._slc_led.start,
+                            tup_export[int_bit],
+                            None,
+                            "LED_{0}_{1}".format(led.upper(), color.upper()),
+                            str(int_bit),
+                        ),
+                        OUT,
+                        "little",
+                        False,
+                    ),
+                )
+                int_bit += 1
 
         # Real IO for switch
-        lst_io = self._modio.io[self._slc_devoff][self._slc_switch.start]
+        lst_io = lst_myios[self._slc_switch.start]
         exp_io = lst_io[0].export
         self.switch = IOBase(
             self,
-            ["flat.switch", 0, 1, self._slc_switch.start, exp_io, None, "Flat_Switch", "0"],
+            ("flat.switch", 0, 1, self._slc_switch.start, exp_io, None, "Flat_Switch", "0"),
             INP,
             "little",
             False,
         )
 
         # Real IO for relais
-        lst_io = self._modio.io[self._slc_devoff][self._slc_dout.start]
+        lst_io = lst_myios[self._slc_dout.start]
         exp_io = lst_io[0].export
         self.relais = IOBase(
             self,
-            ["flat.relais", 0, 1, self._slc_dout.start, exp_io, None, "Flat_Relais", "0"],
+            ("flat.relais", 0, 1, self._slc_dout.start, exp_io, None, "Flat_Relais", "0"),
             OUT,
             "little",
             False,
@@ -1817,7 +1750,7 @@ class Flat(Base):
         # Software watchdog einrichten
         self.wd = IOBase(
             self,
-            ["core.wd", 0, 1, self._slc_led.start, False, None, "WatchDog", "15"],
+            ("core.wd", 0, 1, self._slc_led.start, False, None, "WatchDog", "15"),
             OUT,
             "little",
             False,
@@ -1829,7 +1762,7 @@ class Flat(Base):
 
         :return: 0=off, 1=green, 2=red
         """
-        return self._ba_devdata[self._slc_led.start] & 0b11
+        return self._ba_devdata[self._led_start] & 0b11
 
     def _get_leda2(self) -> int:
         """
@@ -1837,7 +1770,7 @@ class Flat(Base):
 
         :return: 0=off, 1=green, 2=red
         """
-        return (self._ba_devdata[self._slc_led.start] & 0b1100) >> 2
+        return (self._ba_devdata[self._led_start] & 0b1100) >> 2
 
     def _get_leda3(self) -> int:
         """
@@ -1845,7 +1778,7 @@ class Flat(Base):
 
         :return: 0=off, 1=green, 2=red
         """
-        return (self._ba_devdata[self._slc_led.start] & 0b110000) >> 4
+        return (self._ba_devdata[self._led_start] & 0b110000) >> 4
 
     def _get_leda4(self) -> int:
         """
@@ -1853,7 +1786,7 @@ class Flat(Base):
 
         :return: 0=off, 1=green, 2=red
         """
-        return (self._ba_devdata[self._slc_led.start] & 0b11000000) >> 6
+        return (self._ba_devdata[self._led_start] & 0b11000000) >> 6
 
     def _get_leda5(self) -> int:
         """
@@ -1861,7 +1794,7 @@ class Flat(Base):
 
         :return: 0=off, 1=green, 2=red
         """
-        return self._ba_devdata[self._slc_led.start + 1] & 0b11
+        return self._ba_devdata[self._led_start + 1] & 0b11
 
     def _set_leda1(self, value: int) -> None:
         """
@@ -1870,8 +1803,7 @@ class Flat(Base):
         :param value: 0=off, 1=green, 2=red
         """
         if 0 <= value <= 3:
-            self.a1green(bool(value & 1))
-            self.a1red(bool(value & 2))
+            self._write_led_bits((self.a1green, self.a1red), self._led_start, 3, value)
         else:
             raise ValueError("led status must be between 0 and 3")
 
@@ -1882,8 +1814,7 @@ class Flat(Base):
         :param value: 0=off, 1=green, 2=red
         """
         if 0 <= value <= 3:
-            self.a2green(bool(value & 1))
-            self.a2red(bool(value & 2))
+            self._write_led_bits((self.a2green, self.a2red), self._led_start, 12, value << 2)
         else:
             raise ValueError("led status must be between 0 and 3")
 
@@ -1894,8 +1825,7 @@ class Flat(Base):
         :param value: 0=off, 1=green, 2=red
         """
         if 0 <= value <= 3:
-            self.a3green(bool(value & 1))
-            self.a3red(bool(value & 2))
+            self._write_led_bits((self.a3green, self.a3red), self._led_start, 48, value << 4)
         else:
             raise ValueError("led status must be between 0 and 3")
 
@@ -1906,8 +1836,7 @@ class Flat(Base):
         :param value: 0=off, 1=green, 2=red
         """
         if 0 <= value <= 3:
-            self.a4green(bool(value & 1))
-            self.a4red(bool(value & 2))
+            self._write_led_bits((self.a4green, self.a4red), self._led_start, 192, value << 6)
         else:
             raise ValueError("led status must be between 0 and 3")
 
@@ -1918,14 +1847,13 @@ class Flat(Base):
         :param value: 0=off, 1=green, 2=red
         """
         if 0 <= value <= 3:
-            self.a5green(bool(value & 1))
-            self.a5red(bool(value & 2))
+            self._write_led_bits((self.a5green, self.a5red), self._led_start + 1, 3, value)
         else:
             raise ValueError("led status must be between 0 and 3")
 
     def wd_toggle(self):
         """Toggle watchdog bit to prevent a timeout."""
-        self.wd.value = not self.wd.value
+        self._toggle_bit(self.wd)
 
     A1 = property(_get_leda1, _set_leda1)
     A2 = property(_get_leda2, _set_leda2)
@@ -1938,44 +1866,27 @@ class Flat(Base):
         """
         Gibt CPU-Temperatur zurueck.
 
-        :return: CPU-Temperatur in Celsius (-273 wenn nich verfuegbar)
+        :return: CPU-Temperatur in Celsius
         """
-        return (
-            -273
-            if self._slc_temperature is None
-            else int.from_bytes(self._ba_devdata[self._slc_temperature], byteorder="little")
-        )
+        return self._ba_devdata[self._slc_temperature.start]
 
     @property
     def frequency(self) -> int:
         """
         Gibt CPU Taktfrequenz zurueck.
 
-        :return: CPU Taktfrequenz in MHz (-1 wenn nicht verfuegbar)
+        :return: CPU Taktfrequenz in MHz
         """
-        return (
-            -1
-            if self._slc_frequency is None
-            else int.from_bytes(self._ba_devdata[self._slc_frequency], byteorder="little") * 10
-        )
+        return self._ba_devdata[self._slc_frequency.start] * 10
 
 
 class DioModule(Device):
     """Stellt ein DIO / DI / DO Modul dar."""
 
-    __slots__ = "_lst_counter"
-
-    def __init__(self, parentmodio, dict_device, simulator=False):
-        """
-        Erweitert Device-Klasse zum Erkennen von IntIOCounter.
-
-        :rev: :func:`Device.__init__()`
-        """
-        # Stringliste der Byteadressen (alle Module sind gleich)
-        self._lst_counter = list(map(str, range(6, 70, 4)))
+    __slots__ = ()
 
-        # Basisklasse laden
-        super().__init__(parentmodio, dict_device, simulator=simulator)
+    # Stringliste der Byteadressen der IntIOCounter (alle Module sind gleich)
+    _lst_counter = tuple(map(str, range(6, 70, 4)))
 
 
 class RoModule(Device):
@@ -2042,6 +1953,31 @@ class Virtual(Gateway):
 
     __slots__ = ()
 
+    def __build_inpdefaults(self) -> bytearray:
+        """
+        Erzeugt ein Abbild der Inputs mit allen piCtory Defaultwerten.
+
+        Das Abbild startet mit einer Kopie der aktuellen Inputs, so aendern
+        sich nur Bits und Bytes, die von einem IO belegt sind. Muss mit
+        gesperrtem _filelock aufgerufen werden.
+
+        :return: <class 'bytearray'> in der Laenge der Inputs
+        """
+        int_start = self._slc_inp.start
+        ba_defaults = self._ba_devdata[self._slc_inp]
+        for io in self.get_inputs():
+            if io._defaultvalue is None:
+                continue
+            int_address = io._slc_address.start - int_start
+            if io._bitshift:
+                if io._defaultvalue:
+                    ba_defaults[int_address] |= io._bitshift
+                else:
+                    ba_defaults[int_address] &= ~io._bitshift
+            else:
+                ba_defaults[int_address : int_address + io._length] = io._defaultvalue
+        return ba_defaults
+
     def writeinputdefaults(self):
         """
         Schreibt fuer ein virtuelles Device piCtory Defaultinputwerte.
@@ -2058,23 +1994,21 @@ class Virtual(Gateway):
             raise RuntimeError("can not write process image, while system is in monitoring mode")
 
         workokay = True
-        self._filelock.acquire()
 
-        for io in self.get_inputs():
-            self._ba_devdata[io._slc_address] = io._defaultvalue
-
-        # Inputs auf Bus schreiben
-        self._modio._myfh_lck.acquire()
-        try:
-            self._modio._myfh.seek(self._slc_inpoff.start)
-            self._modio._myfh.write(self._ba_devdata[self._slc_inp])
-            if self._modio._buffedwrite:
-                self._modio._myfh.flush()
-        except IOError as e:
-            self._modio._gotioerror("write_inp_def", e)
-            workokay = False
-        finally:
-            self._modio._myfh_lck.release()
-
-        self._filelock.release()
+        # Abbild bei jedem Aufruf erzeugen, Byteorder und Defaultwerte der IOs sind änderbar
+        with self._filelock:
+            ba_inpdefaults = self.__build_inpdefaults()
+            self._ba_devdata[self._slc_inp] = ba_inpdefaults
+
+        # Inputs aus dem lokalen Abbild auf Bus schreiben
+        with self._modio._myfh_lck:
+            try:
+                self._modio._myfh.seek(self._slc_inpoff.start)
+                self._modio._myfh.write(ba_inpdefaults)
+                if self._modio._buffedwrite:
+                    self._modio._myfh.flush()
+            except IOError as e:
+                self._modio._gotioerror("write_inp_def", e)
+                workokay = False
+
         return workokay
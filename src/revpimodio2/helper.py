@@ -465,7 +465,7 @@ class ProcimgWriter(Thread):
                             self.__dict_delay[tup_fire] = ceil(regfunc.delay / 1000 / self._refresh)
 
         # Nach Verarbeitung aller IOs die Bytes kopieren (Lock ist noch drauf)
-        dev._ba_datacp = dev._ba_devdata[:]
+        dev._ba_datacp[:] = dev._ba_devdata
 
     def __exec_th(self) -> None:
         """Laeuft als Thread, der Events als Thread startet."""
@@ -555,7 +555,14 @@ class ProcimgWriter(Thread):
 
                             # Read all device bytes, because it is shared
                             fh.seek(dev.offset)
-                            bytesbuff[dev._slc_devoff] = fh.read(len(dev._ba_devdata))
+                            buff = fh.read(len(dev._ba_devdata))
+                            if len(buff) != len(dev._ba_devdata):
+                                # Puffer dürfen nicht kürzer werden
+                                raise IOError(
+                                    "got {0} of {1} bytes from process image"
+                                    "".format(len(buff), len(dev._ba_devdata))
+                                )
+                            bytesbuff[dev._slc_devoff] = buff
 
                         if self._modio._monitoring or dev._shared_procimg:
                             # Inputs und Outputs in Puffer
@@ -18,7 +18,7 @@ except Exception:
     ioctl = None
 
 
-class IOEvent(object):
+class IOEvent:
     """Basisklasse fuer IO-Events."""
 
     __slots__ = "as_thread", "delay", "edge", "func", "overwrite", "prefire"
@@ -33,7 +33,7 @@ class IOEvent(object):
         self.prefire = prefire
 
 
-class IOList(object):
+class IOList:
     """Basisklasse fuer direkten Zugriff auf IO Objekte."""
 
     def __init__(self, modio):
@@ -342,7 +342,7 @@ class IOList(object):
             raise TypeError("io must be <class 'IOBase'> or sub class")
 
 
-class DeadIO(object):
+class DeadIO:
     """Klasse, mit der ersetzte IOs verwaltet werden."""
 
     __slots__ = "__deadio"
@@ -366,7 +366,7 @@ class DeadIO(object):
     _parentdevice = property(lambda self: None)
 
 
-class IOBase(object):
+class IOBase:
     """
     Basisklasse fuer alle IO-Objekte.
 
@@ -53,7 +53,7 @@ class DevSelect:
         self.values = search_values
 
 
-class RevPiModIO(object):
+class RevPiModIO:
     """
     Klasse fuer die Verwaltung der piCtory Konfiguration.
 
@@ -1129,7 +1129,7 @@ class RevPiModIO(object):
         # Beim Eintritt in mainloop Bytecopy erstellen und prefire anhängen
         for dev in self._lst_refresh:
             with dev._filelock:
-                dev._ba_datacp = dev._ba_devdata[:]
+                dev._ba_datacp[:] = dev._ba_devdata
 
                 # Prefire Events vorbereiten
                 for io in dev._dict_events:
@@ -1230,6 +1230,11 @@ class RevPiModIO(object):
         try:
             self._myfh.seek(0)
             bytesbuff = self._myfh.read(self._length)
+            if len(bytesbuff) != self._length:
+                # Device Puffer haben eine feste Länge und dürfen nicht kürzer werden
+                raise IOError(
+                    "got {0} of {1} bytes from process image".format(len(bytesbuff), self._length)
+                )
         except IOError as e:
             self._gotioerror("readprocimg", e)
             return False
@@ -1239,16 +1244,13 @@ class RevPiModIO(object):
         for dev in mylist:
             if not dev._selfupdate:
                 # FileHandler sperren
-                dev._filelock.acquire()
-
-                if self._monitoring or dev._shared_procimg:
-                    # Alles vom Bus einlesen
-                    dev._ba_devdata[:] = bytesbuff[dev._slc_devoff]
-                else:
-                    # Inputs vom Bus einlesen
-                    dev._ba_devdata[dev._slc_inp] = bytesbuff[dev._slc_inpoff]
-
-                dev._filelock.release()
+                with dev._filelock:
+                    if self._monitoring or dev._shared_procimg:
+                        # Alles vom Bus einlesen
+                        dev._ba_devdata[:] = bytesbuff[dev._slc_devoff]
+                    else:
+                        # Inputs vom Bus einlesen
+                        dev._ba_devdata[dev._slc_inp] = bytesbuff[dev._slc_inpoff]
 
         return True
 
@@ -1308,6 +1310,11 @@ class RevPiModIO(object):
         try:
             self._myfh.seek(0)
             bytesbuff = self._myfh.read(self._length)
+            if len(bytesbuff) != self._length:
+                # Device Puffer haben eine feste Länge und dürfen nicht kürzer werden
+                raise IOError(
+                    "got {0} of {1} bytes from process image".format(len(bytesbuff), self._length)
+                )
         except IOError as e:
             self._gotioerror("syncoutputs", e)
             return False
@@ -1316,9 +1323,8 @@ class RevPiModIO(object):
 
         for dev in mylist:
             if not dev._selfupdate:
-                dev._filelock.acquire()
-                dev._ba_devdata[dev._slc_out] = bytesbuff[dev._slc_outoff]
-                dev._filelock.release()
+                with dev._filelock:
+                    dev._ba_devdata[dev._slc_out] = bytesbuff[dev._slc_outoff]
 
         return True
 
@@ -6,11 +6,13 @@ __license__ = "LGPLv2"
 
 import socket
 import warnings
+import weakref
 from configparser import ConfigParser
 from json import loads as jloads
 from re import compile
-from struct import pack, unpack
+from struct import Struct, pack, unpack
 from threading import Event, Lock, Thread
+from timeit import default_timer
 
 from .device import Device
 from .errors import DeviceNotFoundError
@@ -34,6 +36,10 @@ HASH_FAIL = b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
 # Header start/stop
 HEADER_START = b"\x01"
 HEADER_STOP = b"\x17"
+# Scatter-gather senden, wenn von Plattform unterstützt
+_has_sendmsg = hasattr(socket.socket, "sendmsg")
+# Position und Länge eines Datenblocks im Schreibpuffer
+_pack_block = Struct("<HH").pack
 
 
 class AclException(Exception):
@@ -60,19 +66,23 @@ class NetFH(Thread):
     __slots__ = (
         "__buff_size",
         "__buff_block",
+        "__buff_view",
         "__buff_recv",
         "__by_buff",
         "__check_replace_ios",
         "__config_changed",
         "__int_buff",
+        "__last_traffic",
         "__dictdirty",
         "__flusherr",
         "__replace_ios_h",
+        "__sock_finalizer",
         "__pictory_h",
         "__position",
         "__sockerr",
         "__sockend",
         "__socklock",
+        "__sockwake",
         "__timeout",
         "__waitsync",
         "_address",
@@ -93,17 +103,21 @@ class NetFH(Thread):
 
         self.__buff_size = 2048  # Values up to 32 are static in code!
         self.__buff_block = bytearray(self.__buff_size)
+        self.__buff_view = memoryview(self.__buff_block)
         self.__buff_recv = bytearray()
         self.__by_buff = bytearray()
         self.__check_replace_ios = check_replace_ios
         self.__config_changed = False
         self.__int_buff = 0
+        self.__last_traffic = 0.0
         self.__dictdirty = {}
         self.__replace_ios_h = b""
         self.__pictory_h = b""
+        self.__sock_finalizer = None
         self.__sockerr = Event()
         self.__sockend = Event()
         self.__socklock = Lock()
+        self.__sockwake = Event()
         self.__timeout = None
         self.__waitsync = None
         self._address = address
@@ -126,8 +140,12 @@ class NetFH(Thread):
         self.__position = 0
         self.start()
 
-    def __del__(self):
-        """NetworkFileHandler beenden."""
+    def __enter__(self):
+        """NetworkFileHandler als Context-Manager verwenden."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """NetworkFileHandler beim Verlassen beenden."""
         self.close()
 
     def __check_acl(self, bytecode: bytes) -> None:
@@ -142,7 +160,7 @@ class NetFH(Thread):
         if bytecode == b"\x18":
             # Alles beenden, wenn nicht erlaubt
             self.__sockend.set()
-            self.__sockerr.set()
+            self.__set_sockerr()
             self._serversock.close()
             raise AclException(
                 "write access to the process image is not permitted - use "
@@ -150,6 +168,28 @@ class NetFH(Thread):
                 "reload revpipyload!"
             )
 
+    def __set_sockerr(self) -> None:
+        """Markiert einen Netzwerkfehler und weckt den Sync-Thread."""
+        self.__sockerr.set()
+        self.__sockwake.set()
+
+    def __send_timeout(self, value: int) -> None:
+        """
+        Timeoutwert an RevPi Server senden.
+
+        Diese Funktion wirft keine Exception bei einem uebertragungsfehler,
+        veranlasst aber eine Neuverbindung.
+
+        :param value: Timeout in Millisekunden
+        """
+        try:
+            # b CM ii xx 00000000 b = 16
+            buff = self._direct_sr(pack("=c2sH10xc", HEADER_START, b"CF", value, HEADER_STOP), 1)
+            if buff != b"\x1e":
+                raise IOError("set timeout error on network")
+        except Exception:
+            self.__set_sockerr()
+
     def __set_systimeout(self, value: int) -> None:
         """
         Systemfunktion fuer Timeoutberechnung.
@@ -166,6 +206,9 @@ class NetFH(Thread):
             # 45 Prozent vom Timeout für Synctimer verwenden
             self.__waitsync = self.__timeout / 100 * 45
 
+            # Sync-Thread muss Wartezeit mit neuem Timeout berechnen
+            self.__sockwake.set()
+
         else:
             raise ValueError("value must between 10 and 60000 milliseconds")
 
@@ -226,22 +269,29 @@ class NetFH(Thread):
                 self._serversock = so
                 self.__sockerr.clear()
 
-            # Timeout setzen
-            self.set_timeout(int(self.__timeout * 1000))
+                # Socket ohne Lock schließen, falls close() nie aufgerufen wird
+                if self.__sock_finalizer is not None:
+                    self.__sock_finalizer.detach()
+                self.__sock_finalizer = weakref.finalize(self, so.close)
+
+            # Timeout auf neuer Verbindung immer setzen
+            self.__send_timeout(int(self.__timeout * 1000))
 
             # DirtyBytes übertragen
             for pos in self.__dictdirty:
                 self.set_dirtybytes(pos, self.__dictdirty[pos])
 
-    def _direct_sr(self, send_bytes: bytes, recv_len: int) -> bytes:
+    def _direct_sr(self, send_bytes: bytes, recv_len: int, send_payload=b"") -> bytes:
         """
         Secure send and receive function for network handler.
 
         Will raise exception on closed network handler or network errors and
-        set the sockerr flag.
+        set the sockerr flag. The payload is sent after send_bytes without
+        joining both buffers, if the platform supports sendmsg.
 
         :param send_bytes: Bytes to send or empty
         :param recv_len: Amount of bytes to receive
+        :param send_payload: Bytes to send after send_bytes or empty
         :return: Received bytes
         """
         if self.__sockend.is_set():
@@ -249,18 +299,29 @@ class NetFH(Thread):
         if self.__sockerr.is_set():
             raise IOError("not allowed while reconnect")
 
+        buffers = []
         try:
             self.__socklock.acquire()
 
-            counter = 0
-            send_len = len(send_bytes)
-            while counter < send_len:
+            # Create memoryviews in socklock environment, so write() is not
+            # able to resize the payload while it is exported
+            buffers.extend(memoryview(buff) for buff in (send_bytes, send_payload) if buff)
+
+            while buffers:
                 # Send loop to trigger timeout of socket on each send
-                sent = self._serversock.send(send_bytes[counter:])
+                if _has_sendmsg:
+                    sent = self._serversock.sendmsg(buffers)
+                else:
+                    sent = self._serversock.send(buffers[0])
                 if sent == 0:
-                    self.__sockerr.set()
+                    self.__set_sockerr()
                     raise IOError("lost network connection while send")
-                counter += sent
+
+                # Remove sent data from buffer list
+                while buffers and sent >= len(buffers[0]):
+                    sent -= len(buffers.pop(0))
+                if sent:
+                    buffers[0] = buffers[0][sent:]
 
             self.__buff_recv.clear()
             while recv_len > 0:
@@ -269,16 +330,19 @@ class NetFH(Thread):
                 )
                 if count == 0:
                     raise IOError("lost network connection while receive")
-                self.__buff_recv += self.__buff_block[:count]
+                self.__buff_recv += self.__buff_view[:count]
                 recv_len -= count
 
             # Create copy in socklock environment
             return_buffer = bytes(self.__buff_recv)
+            self.__last_traffic = default_timer()
         except Exception:
-            self.__sockerr.set()
+            self.__set_sockerr()
             raise
 
         finally:
+            # Release memoryviews, so the caller is able to resize its buffer
+            buffers.clear()
             self.__socklock.release()
 
         return return_buffer
@@ -330,7 +394,7 @@ class NetFH(Thread):
             self.__dictdirty.clear()
             raise
         except Exception:
-            self.__sockerr.set()
+            self.__set_sockerr()
 
     def close(self) -> None:
         """Verbindung trennen."""
@@ -338,7 +402,7 @@ class NetFH(Thread):
             return
 
         self.__sockend.set()
-        self.__sockerr.set()
+        self.__set_sockerr()
 
         # Vom Socket sauber trennen
         if self._serversock is not None:
@@ -373,9 +437,9 @@ class NetFH(Thread):
                     self.__int_buff,
                     len(self.__by_buff),
                     HEADER_STOP,
-                )
-                + self.__by_buff,
+                ),
                 1,
+                self.__by_buff,
             )
         except Exception:
             raise
@@ -388,7 +452,7 @@ class NetFH(Thread):
             # ACL prüfen und ggf Fehler werfen
             self.__check_acl(buff)
 
-            self.__sockerr.set()
+            self.__set_sockerr()
             raise IOError("flush error on network")
 
     def get_closed(self) -> bool:
@@ -448,13 +512,13 @@ class NetFH(Thread):
 
         # b CM xx ii iiii0000 b = 16
         buff = self._direct_sr(
-            pack("=c2s2xHI4xc", HEADER_START, b"IC", len(arg), request, HEADER_STOP) + arg, 1
+            pack("=c2s2xHI4xc", HEADER_START, b"IC", len(arg), request, HEADER_STOP), 1, arg
         )
         if buff != b"\x1e":
             # ACL prüfen und ggf Fehler werfen
             self.__check_acl(buff)
 
-            self.__sockerr.set()
+            self.__set_sockerr()
             raise IOError("ioctl error on network")
 
     def read(self, length: int) -> bytes:
@@ -534,9 +598,14 @@ class NetFH(Thread):
     def run(self) -> None:
         """Handler fuer Synchronisierung."""
         state_reconnect = False
+        # Abstand der Syncs bei Leerlauf, wird bis zum halben Timeout verdoppelt
+        sync_wait = self.__waitsync
         while not self.__sockend.is_set():
+            self.__sockwake.clear()
+
             # Bei Fehlermeldung neu verbinden
             if self.__sockerr.is_set():
+                sync_wait = self.__waitsync
                 if not state_reconnect:
                     state_reconnect = True
                     warnings.warn("got a network error and try to reconnect", RuntimeWarning)
@@ -549,6 +618,16 @@ class NetFH(Thread):
                     state_reconnect = False
                     warnings.warn("successfully reconnected after network error", RuntimeWarning)
 
+            # Server sieht sync_wait plus Laufzeit, daher höchstens halben Timeout
+            # verwenden und bei jedem Durchlauf aus aktuellem Timeout berechnen
+            sync_wait = min(sync_wait, self.__timeout / 2)
+
+            # Sync nur senden, wenn seit sync_wait keine Daten übertragen wurden
+            idle = default_timer() - self.__last_traffic
+            if idle < sync_wait:
+                self.__sockwake.wait(sync_wait - idle)
+                continue
+
             # Kein Fehler aufgetreten, sync durchführen wenn socket frei
             if self.__socklock.acquire(blocking=False):
                 try:
@@ -560,21 +639,25 @@ class NetFH(Thread):
                         count = self._serversock.recv_into(self.__buff_block, recv_lenght)
                         if count == 0:
                             raise IOError("lost network connection on sync")
-                        self.__buff_recv += self.__buff_block[:count]
+                        self.__buff_recv += self.__buff_view[:count]
                         recv_lenght -= count
 
                 except IOError:
-                    self.__sockerr.set()
+                    self.__set_sockerr()
                 else:
                     if self.__buff_recv != b"\x06\x16":
                         warnings.warn("data error on network sync", RuntimeWarning)
-                        self.__sockerr.set()
+                        self.__set_sockerr()
                         continue
+                    self.__last_traffic = default_timer()
+
+                    # Leerlauf, nächsten Sync hinauszögern (Obergrenze siehe oben)
+                    sync_wait *= 2
                 finally:
                     self.__socklock.release()
 
             # Warten nach Sync damit Instantiierung funktioniert
-            self.__sockerr.wait(self.__waitsync)
+            self.__sockwake.wait(self.__waitsync)
 
     def seek(self, position: int) -> None:
         """Springt an angegebene Position.
@@ -606,9 +689,9 @@ class NetFH(Thread):
         try:
             # b CM ii ii 00000000 b = 16
             buff = self._direct_sr(
-                pack("=c2sHH8xc", HEADER_START, b"EY", position, len(dirtybytes), HEADER_STOP)
-                + dirtybytes,
+                pack("=c2sHH8xc", HEADER_START, b"EY", position, len(dirtybytes), HEADER_STOP),
                 1,
+                dirtybytes,
             )
 
             if buff != b"\x1e":
@@ -621,7 +704,7 @@ class NetFH(Thread):
             self.__dictdirty.clear()
             raise
         except Exception:
-            self.__sockerr.set()
+            self.__set_sockerr()
 
     def set_timeout(self, value: int) -> None:
         """
@@ -632,16 +715,13 @@ class NetFH(Thread):
         if self.__sockend.is_set():
             raise ValueError("I/O operation on closed file")
 
+        # Unveränderten Timeout nicht erneut übertragen
+        if isinstance(value, int) and value / 1000 == self.__timeout:
+            return
+
         # Timeoutwert verarbeiten (könnte Exception auslösen)
         self.__set_systimeout(value)
-
-        try:
-            # b CM ii xx 00000000 b = 16
-            buff = self._direct_sr(pack("=c2sH10xc", HEADER_START, b"CF", value, HEADER_STOP), 1)
-            if buff != b"\x1e":
-                raise IOError("set timeout error on network")
-        except Exception:
-            self.__sockerr.set()
+        self.__send_timeout(value)
 
     def tell(self) -> int:
         """
@@ -669,19 +749,18 @@ class NetFH(Thread):
         if self.__sockerr.is_set():
             raise IOError("not allowed while reconnect")
 
+        length = len(bytebuff)
         with self.__socklock:
             self.__int_buff += 1
 
             # Datenblock mit Position und Länge in Puffer ablegen
-            self.__by_buff += (
-                self.__position.to_bytes(length=2, byteorder="little")
-                + len(bytebuff).to_bytes(length=2, byteorder="little")
-                + bytebuff
-            )
+            by_buff = self.__by_buff
+            by_buff += _pack_block(self.__position, length)
+            by_buff += bytebuff
 
         # TODO: Bufferlänge und dann flushen?
 
-        return len(bytebuff)
+        return length
 
     closed = property(get_closed)
     config_changed = property(get_config_changed)
@@ -776,9 +855,41 @@ class RevPiNetIO(_RevPiModIO):
         self._myfh = self._create_myfh()
 
         # Nur Konfigurieren, wenn nicht vererbt
-        if type(self) == RevPiNetIO:
+        if type(self) is RevPiNetIO:
             self._configure(self.get_jconfigrsc())
 
+    def __set_dirtybytes(self, dev: Device) -> None:
+        """
+        Sendet die piCtory Defaultwerte eines Devices an den PLC Server.
+
+        :param dev: Device, dessen Outputs verwendet werden
+        """
+        dirtybytes = bytearray()
+        for lst_io in self.io[dev._slc_outoff]:
+            listlen = len(lst_io)
+
+            if listlen == 1:
+                # Byteorientierte Outputs direkt übernehmen
+                dirtybytes += lst_io[0]._defaultvalue
+
+            elif listlen > 1:
+                # Bitorientierte Outputs in ein Byte zusammenfassen
+                int_byte = 0
+                lstbyte = lst_io.copy()
+                lstbyte.reverse()
+
+                for bitio in lstbyte:
+                    # Von hinten die bits nach vorne schieben
+                    int_byte <<= 1
+                    if bitio is not None:
+                        int_byte += 1 if bitio._defaultvalue else 0
+
+                # Errechneten Int-Wert in ein Byte umwandeln
+                dirtybytes += int_byte.to_bytes(length=1, byteorder="little")
+
+        # Dirtybytes an PLC Server senden
+        self._myfh.set_dirtybytes(dev._offset + dev._slc_out.start, dirtybytes)
+
     def _create_myfh(self):
         """
         Erstellt NetworkFileObject.
@@ -840,9 +951,8 @@ class RevPiNetIO(_RevPiModIO):
 
         :return: <class 'dict'> der piCtory Konfiguration
         """
-        mynh = NetFH(self._address, False)
-        byte_buff = mynh.readpictory()
-        mynh.close()
+        with NetFH(self._address, False) as mynh:
+            byte_buff = mynh.readpictory()
         return jloads(byte_buff.decode("utf-8"))
 
     def get_reconnecting(self) -> bool:
@@ -869,10 +979,7 @@ class RevPiNetIO(_RevPiModIO):
             self._myfh.clear_dirtybytes()
         else:
             dev = device if isinstance(device, Device) else self.device.__getitem__(device)
-            mylist = [dev]
-
-            for dev in mylist:
-                self._myfh.clear_dirtybytes(dev._offset + dev._slc_out.start)
+            self._myfh.clear_dirtybytes(dev._offset + dev._slc_out.start)
 
     def net_setdefaultvalues(self, device=None) -> None:
         """
@@ -887,37 +994,11 @@ class RevPiNetIO(_RevPiModIO):
             raise RuntimeError("can not send default values, while system is in monitoring mode")
 
         if device is None:
-            mylist = self.device
+            for dev in self.device:
+                self.__set_dirtybytes(dev)
         else:
             dev = device if isinstance(device, Device) else self.device.__getitem__(device)
-            mylist = [dev]
-
-        for dev in mylist:
-            dirtybytes = bytearray()
-            for lst_io in self.io[dev._slc_outoff]:
-                listlen = len(lst_io)
-
-                if listlen == 1:
-                    # Byteorientierte Outputs direkt übernehmen
-                    dirtybytes += lst_io[0]._defaultvalue
-
-                elif listlen > 1:
-                    # Bitorientierte Outputs in ein Byte zusammenfassen
-                    int_byte = 0
-                    lstbyte = lst_io.copy()
-                    lstbyte.reverse()
-
-                    for bitio in lstbyte:
-                        # Von hinten die bits nach vorne schieben
-                        int_byte <<= 1
-                        if bitio is not None:
-                            int_byte += 1 if bitio._defaultvalue else 0
-
-                    # Errechneten Int-Wert in ein Byte umwandeln
-                    dirtybytes += int_byte.to_bytes(length=1, byteorder="little")
-
-            # Dirtybytes an PLC Server senden
-            self._myfh.set_dirtybytes(dev._offset + dev._slc_out.start, dirtybytes)
+            self.__set_dirtybytes(dev)
 
     config_changed = property(get_config_changed)
     reconnecting = property(get_reconnecting)
@@ -969,9 +1050,9 @@ class RevPiNetIOSelected(RevPiNetIO):
             shared_procimg,
         )
 
-        if type(deviceselection) is not DevSelect:
+        if not isinstance(deviceselection, DevSelect):
             # Convert to tuple
-            if type(deviceselection) not in (list, tuple):
+            if not isinstance(deviceselection, (list, tuple)):
                 deviceselection = (deviceselection,)
 
             # Automatic search for name and position depends on type int / str
@@ -1033,7 +1114,7 @@ class RevPiNetIODriver(RevPiNetIOSelected):
         :ref: :func:`RevPiModIO.__init__()`
         """
         # Parent mit monitoring=False und simulator=True laden
-        if type(virtdev) not in (list, tuple):
+        if not isinstance(virtdev, (list, tuple)):
             virtdev = (virtdev,)
         dev_select = DevSelect(DeviceType.VIRTUAL, "", virtdev)
         super().__init__(
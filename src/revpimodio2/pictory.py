@@ -14,7 +14,17 @@ __license__ = "LGPLv2"
 # - RevPiGateCANopen_20161102_1_0.rap
 
 
-class ProductType:
+class _Frozen(type):
+    """Metaclass to prevent changes of the pictory values at runtime."""
+
+    def __setattr__(cls, name, value):
+        raise AttributeError("can not set attribute '{0}' of {1}".format(name, cls.__name__))
+
+    def __delattr__(cls, name):
+        raise AttributeError("can not delete attribute '{0}' of {1}".format(name, cls.__name__))
+
+
+class ProductType(metaclass=_Frozen):
     CON_BT = 111
     CON_CAN = 109
     CON_MBUS = 110
@@ -64,8 +74,30 @@ class ProductType:
     VIRTUAL_TIMER = 28673
     VIRTUAL_RAW = 32768
 
+    @classmethod
+    def name_of(cls, value: int) -> str:
+        """
+        Get name of a product type value.
+
+        :param value: Product type number of piCtory
+        :return: Name of product type or empty string, if unknown
+        """
+        return _product_type_names.get(value, "")
+
+
+def _names_by_value(cls) -> dict:
+    """Map the integer values of a pictory class to the first defined name."""
+    names = {}
+    for name, value in cls.__dict__.items():
+        if isinstance(value, int) and not name.startswith("_"):
+            names.setdefault(value, name)
+    return names
+
+
+_product_type_names = _names_by_value(ProductType)
+
 
-class DeviceType:
+class DeviceType(metaclass=_Frozen):
     """Module key "type" in piCtory file."""
 
     IGNORED = ""
@@ -76,7 +108,7 @@ class DeviceType:
     VIRTUAL = "VIRTUAL"  # All virtual devices
 
 
-class AIO:
+class AIO(metaclass=_Frozen):
     """Memory value mappings for RevPi AIO 1.0 (RevPiAIO_20170301_1_0.rap)."""
 
     OUT_RANGE_OFF = 0  # Off
@@ -150,7 +182,7 @@ class AIO:
     RTD_4_WIRE = 1  # 4-wire
 
 
-class DI:
+class DI(metaclass=_Frozen):
     """Memory value mappings for RevPi DI 1.0  (RevPiDI_20160818_1_0.rap)."""
 
     IN_MODE_DIRECT = 0  # Direct
@@ -164,7 +196,7 @@ class DI:
     IN_DEBOUNCE_3MS = 3  # 3ms
 
 
-class DO:
+class DO(metaclass=_Frozen):
     """Memory value mappings for RevPi DO 1.0  (RevPiDO_20160818_1_0.rap)."""
 
     OUT_PWM_FREQ_40HZ = 1  # 40Hz 1%
@@ -180,7 +212,7 @@ class DIO(DI, DO):
     pass
 
 
-class MIO:
+class MIO(metaclass=_Frozen):
     """Memory value mappings for RevPi MIO 1.0 (RevPiMIO_20200901_1_0.rap)."""
 
     ENCODER_MODE_DISABLED = 0
@@ -199,7 +231,7 @@ class MIO:
     AO_MODE_LOGIC_LEVEL_OUTPUT = 1
 
 
-class COMPACT:
+class COMPACT(metaclass=_Frozen):
     """Memory value mappings for RevPi Compact 1.0 (RevPiCompact_20171023_1_0.rap)."""
 
     DIN_DEBOUNCE_OFF = 0  # Off
@@ -213,7 +245,7 @@ class COMPACT:
     AIN_MODE_PT1000 = 7  # PT1000
 
 
-class FLAT:
+class FLAT(metaclass=_Frozen):
     """Memory value mappings for RevPi Flat 1.0 (RevPiFlat_20200921_1_0.rap)."""
 
     IN_RANGE_0_10V = 0
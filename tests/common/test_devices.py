@@ -31,11 +31,21 @@ class TestDevicesModule(TestRevPiModIO):
         self.assertEqual(64 in rpi.device, True)
         self.assertEqual(128 in rpi.device, False)
         self.assertEqual(rpi.device.virt01 in rpi.device, True)
+        self.assertEqual(self.modio().device.virt01 in rpi.device, False)
         self.assertIsInstance(bytes(rpi.device.virt01), bytes)
 
         # We have 7 devices in config.rsc file
         self.assertEqual(len(rpi.device), 7)
 
+        # Autorefresh registers a device only once
+        rpi.device.virt01.autorefresh()
+        rpi.device.virt01.autorefresh()
+        self.assertEqual(rpi._lst_refresh, [rpi.device.virt01])
+        rpi.device.virt01.autorefresh(False)
+        rpi.device.virt01.autorefresh(False)
+        self.assertEqual(rpi._lst_refresh, [])
+        rpi.exit()
+
     def test_devs_and_ios(self):
         """Test IO grouping of devices."""
         rpi = self.modio()
@@ -109,6 +119,12 @@ class TestDevicesModule(TestRevPiModIO):
 
         del rpi.device[rpi.device.di01]
 
+        # Iteration after deleting is still sorted by offset
+        lst_devices = list(rpi.device)
+        self.assertEqual(len(lst_devices), 4)
+        self.assertNotIn("di01", [dev.name for dev in lst_devices])
+        self.assertEqual(lst_devices, sorted(lst_devices, key=lambda dev: dev.offset))
+
     def test_new_basedevice(self):
         """Test unknown (new) base device."""
         rpi = self.modio(configrsc="config_new_base.rsc")
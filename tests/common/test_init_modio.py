@@ -140,7 +140,7 @@ class TestInitModio(TestRevPiModIO):
         with self.assertWarnsRegex(
             Warning,
             r"(Device offset ERROR in piCtory configuration!|"
-            r"is not in the device offset and will be ignored)",
+            r"(is|are) not in the device offset and will be ignored)",
         ):
             rpi = self.modio(configrsc="config_bad_offset.rsc")
         del rpi
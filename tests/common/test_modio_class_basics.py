@@ -5,8 +5,10 @@ __copyright__ = "Copyright (C) 2024 Sven Sager"
 __license__ = "GPLv2"
 
 import os
+import sys
 from os.path import join, dirname
 from signal import SIGINT
+from subprocess import run
 from threading import Event
 
 from .. import TestRevPiModIO
@@ -16,6 +18,26 @@ class TestModioClassBasics(TestRevPiModIO):
 
     data_dir = dirname(__file__)
 
+    def test_package_submodules(self):
+        """Test submodule access after a plain package import in a fresh interpreter."""
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+        result = run(
+            [
+                sys.executable,
+                "-c",
+                "import revpimodio2; print(revpimodio2.io.IntIO.__name__, "
+                "revpimodio2.modio.__name__, revpimodio2.device.__name__)",
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(
+            result.stdout.split(), ["IntIO", "revpimodio2.modio", "revpimodio2.device"]
+        )
+
     def test_appclass(self):
         """Test the .app class."""
         rpi = self.modio()
@@ -90,3 +112,13 @@ class TestModioClassBasics(TestRevPiModIO):
         self.assertEqual(rpi.device.virt01.writeprocimg(), True)
         self.assertEqual(rpi.device.virt01.syncoutputs(), True)
         self.assertEqual(rpi.device.virt01.readprocimg(), True)
+
+        # A short process image must not resize or lock the device buffers
+        len_devdata = len(rpi.device.virt01._ba_devdata)
+        self.fh_procimg.truncate(rpi.device.virt01.offset + 1)
+        with self.assertWarnsRegex(RuntimeWarning, r"io error"):
+            self.assertEqual(rpi.readprocimg(), False)
+        with self.assertWarnsRegex(RuntimeWarning, r"io error"):
+            self.assertEqual(rpi.syncoutputs(), False)
+        self.assertEqual(len(rpi.device.virt01._ba_devdata), len_devdata)
+        self.assertFalse(rpi.device.virt01._filelock.locked())
@@ -105,3 +105,17 @@ class TestIos(TestRevPiModIO):
         self.assertEqual(rpi.device[65]._ba_devdata[32:38], b"\x20\x00\x00\x00\x00\x00")
         rpi.io.OutBit_48.value = True
         self.assertEqual(rpi.device[65]._ba_devdata[32:38], b"\x20\x00\x00\x00\x00\x80")
+
+    def test_inputdefaults_byteorder(self):
+        """Test writeinputdefaults after changing the byteorder of a word input."""
+        rpi = self.modio(configrsc="config_supervirt.rsc")
+        self.assertTrue(rpi.device[65].writeinputdefaults())
+        self.fh_procimg.seek(rpi.io.InWord_1.address)
+        self.assertEqual(self.fh_procimg.read(2), b"\x02\x01")
+
+        # The byteorder reverses the default value, which has to be written this way
+        rpi.io.InWord_1.byteorder = "big"
+        self.assertTrue(rpi.device[65].writeinputdefaults())
+        self.fh_procimg.seek(rpi.io.InWord_1.address)
+        self.assertEqual(self.fh_procimg.read(2), b"\x01\x02")
+        self.assertEqual(rpi.io.InWord_1.value, 258)
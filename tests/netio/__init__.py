@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""Init file for test group."""
+__author__ = "Sven Sager"
+__copyright__ = "Copyright (C) 2024 Sven Sager"
+__license__ = "GPLv2"
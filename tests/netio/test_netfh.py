@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Tests of the network file handler."""
+__author__ = "Sven Sager"
+__copyright__ = "Copyright (C) 2024 Sven Sager"
+__license__ = "GPLv2"
+
+import socket
+from unittest import TestCase
+from unittest.mock import patch
+
+from revpimodio2 import netio
+
+
+class ShortSendSocket:
+    """Socket wrapper, which sends only max_send bytes per call."""
+
+    def __init__(self, sock, max_send):
+        self._sock = sock
+        self.max_send = max_send
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+    def connect(self, address):
+        pass
+
+    def settimeout(self, value):
+        # Keep the short timeout of the test to fail instead of blocking
+        pass
+
+    def send(self, data):
+        return self._sock.send(data[: self.max_send])
+
+    def sendmsg(self, buffers):
+        return self._sock.send(b"".join(buffers)[: self.max_send])
+
+
+def recv_exactly(sock, length):
+    """Receive length bytes from socket."""
+    buff = b""
+    while len(buff) < length:
+        block = sock.recv(length - len(buff))
+        if not block:
+            break
+        buff += block
+    return buff
+
+
+class TestNetFH(TestCase):
+    def test_direct_sr_short_send(self):
+        """Send header and payload with partial sends of the socket."""
+        header = bytes(range(100, 116))
+        payload = bytes(range(40))
+
+        for has_sendmsg in (True, False):
+            for max_send in (1, 3, 15, 16, 17, 1000):
+                with self.subTest(has_sendmsg=has_sendmsg, max_send=max_send):
+                    sock, peer = socket.socketpair()
+                    sock.settimeout(2.0)
+                    peer.settimeout(2.0)
+
+                    # Hash of piCtory and acknowledge of timeout for connect
+                    peer.sendall(b"\x00" * 16 + b"\x1e")
+                    with patch.object(netio, "_has_sendmsg", has_sendmsg), patch.object(
+                        netio.socket, "socket", return_value=ShortSendSocket(sock, max_send)
+                    ):
+                        fh = netio.NetFH(("127.0.0.1", 55234), False, 60000)
+                        try:
+                            # Hash request and timeout command of connect
+                            self.assertEqual(len(recv_exactly(peer, 32)), 32)
+
+                            peer.sendall(b"\x1e")
+                            self.assertEqual(fh._direct_sr(header, 1, payload), b"\x1e")
+                            self.assertEqual(
+                                recv_exactly(peer, len(header) + len(payload)), header + payload
+                            )
+
+                            # Send without payload
+                            peer.sendall(b"\x1e\x1f")
+                            self.assertEqual(fh._direct_sr(header, 2), b"\x1e\x1f")
+                            self.assertEqual(recv_exactly(peer, len(header)), header)
+                        finally:
+                            fh.close()
+                            peer.close()
+                            sock.close()
@@ -30,9 +30,27 @@ class TestReplaceIO(TestRevPiModIO):
         rpi.io.pbit0_7.replace_io("test5", frm="?", bit=5, byteorder="big")
         self.assertFalse(rpi.io.test4())
         self.assertFalse(rpi.io.test4.value)
+        self.assertIn(rpi.io.test4, rpi.device.virt01.get_inputs())
+        self.assertNotIn(rpi.io.test4, rpi.device.virt01.get_outputs())
+        self.assertIn("test4", rpi.device.virt01)
+        self.assertNotIn("pbit0_7", rpi.device.virt01)
         with self.assertRaises(MemoryError):
             rpi.io.pbit0_7.replace_io("test4_2", frm="?", bit=4)
 
+        # Bit defaults of replaced IOs are written by writeinputdefaults
+        rpi.io.pbit0_7.replace_io("test6", frm="?", bit=6, defaultvalue=True)
+        self.assertTrue(rpi.device.virt01.writeinputdefaults())
+        self.assertTrue(rpi.io.test6.value)
+        self.assertFalse(rpi.io.test4.value)
+
+        # Bits without IO keep their value, bits of IOs get the default value
+        self.fh_procimg.seek(rpi.io.test4.address)
+        self.fh_procimg.write(b"\x91")
+        rpi.readprocimg()
+        self.assertTrue(rpi.device.virt01.writeinputdefaults())
+        self.fh_procimg.seek(rpi.io.test4.address)
+        self.assertEqual(self.fh_procimg.read(1), b"\xc1")
+
         with self.assertRaises(ValueError):
             rpi.io.meldung0_7.replace_io("outtest", "?", bit=100)
         with self.assertRaises(ValueError):
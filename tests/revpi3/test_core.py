@@ -65,10 +65,23 @@ class TestRevPiCore(TestRevPiModIO):
             self.assertTrue(rpi.core.a2red())
             self.assertFalse(rpi.core.a2green())
 
+        # LED bits must be marked for writing with shared process image
+        rpi.core.shared_procimg(True)
+        rpi.core.A1 = GREEN
+        self.assertIn(rpi.core.a1green, rpi.core._shared_write)
+        self.assertIn(rpi.core.a1red, rpi.core._shared_write)
+        rpi.writeprocimg()
+        self.assertEqual(get_led_byte(), b"\x09")
+        rpi.core.shared_procimg(False)
+
         # Software watchdog (same bit as hardware watchdog on connect 3)
         self.assertFalse(rpi.core.wd.value)
         rpi.core.wd_toggle()
         self.assertTrue(rpi.core.wd.value)
+        self.assertEqual(rpi.core.A1, GREEN)
+        rpi.core.wd_toggle()
+        self.assertFalse(rpi.core.wd.value)
+        self.assertEqual(rpi.core.A1, GREEN)
 
         self.assertIsInstance(rpi.core.status, int)
         self.assertIsInstance(rpi.core.picontrolrunning, bool)
@@ -91,6 +104,11 @@ class TestRevPiCore(TestRevPiModIO):
         self.assertEqual(rpi.core.errorlimit2, 1100)
         with self.assertRaises(ValueError):
             rpi.core.errorlimit2 = 65999
+        with self.assertRaises(TypeError):
+            rpi.core.errorlimit1 = 5.0
+        with self.assertRaises(TypeError):
+            rpi.core.errorlimit2 = "5"
+        self.assertEqual(rpi.core.errorlimit1, 10)
 
     def test_core_old_errorlimits(self):
         """Test non-existing error limits of first core rap file."""
@@ -46,6 +46,31 @@ class TestRevPi4(TestRevPiModIO):
             with self.assertRaises(ValueError):
                 set_led(8)
 
+        # Mixed colors on all LEDs, red and green are swapped in the process image
+        for led_set, value in zip(
+            (rpi.core._set_leda1, rpi.core._set_leda2, rpi.core._set_leda3, rpi.core._set_leda4),
+            (5, 3, 6, 1),
+        ):
+            led_set(value)
+        rpi.core.A5 = 7
+        self.assertEqual(
+            rpi.io.RevPiLED.get_value(),
+            (6 | 3 << 3 | 5 << 6 | 2 << 9 | 7 << 12).to_bytes(2, "little"),
+        )
+        self.assertEqual(
+            (rpi.core.A1, rpi.core.A2, rpi.core.A3, rpi.core.A4, rpi.core.A5), (5, 3, 6, 1, 7)
+        )
+
+        # LED A3 is spread over two bytes and must be marked for shared writing
+        rpi.core.shared_procimg(True)
+        rpi.core.A3 = revpimodio2.BLUE
+        self.assertEqual(
+            rpi.core._shared_write, {rpi.core.a3red, rpi.core.a3green, rpi.core.a3blue}
+        )
+        rpi.writeprocimg()
+        rpi.core.shared_procimg(False)
+        self.assertEqual(rpi.core.A3, revpimodio2.BLUE)
+
         self.assertIsInstance(rpi.core.temperature, int)
         self.assertIsInstance(rpi.core.frequency, int)
 
@@ -36,3 +36,23 @@ class ModuleImport(unittest.TestCase):
             revpimodio2._internal.acheck(str, arg01=None, arg02_noneok="test")
         with self.assertRaises(TypeError):
             revpimodio2._internal.acheck(bool, arg01=True, arg02=None)
+        with self.assertRaisesRegex(TypeError, "'token'"):
+            revpimodio2._internal.acheck(str, token_noneok=0)
+
+    def test_pictory_product_names(self):
+        """Test reverse lookup of pictory product types."""
+        from revpimodio2.pictory import ProductType
+
+        self.assertEqual(ProductType.name_of(ProductType.REVPI_CONNECT), "REVPI_CONNECT")
+        self.assertEqual(ProductType.name_of(83), "GATEWAY_PROFINET_SITARA")
+        self.assertEqual(ProductType.name_of(-1), "")
+
+    def test_pictory_frozen(self):
+        """Test pictory values can not be changed at runtime."""
+        from revpimodio2.pictory import AIO, DIO
+
+        with self.assertRaises(AttributeError):
+            AIO.OUT_RANGE_OFF = 1
+        with self.assertRaises(AttributeError):
+            del DIO.IN_MODE_DIRECT
+        self.assertEqual(AIO.OUT_RANGE_OFF, 0)